@@ -0,0 +1,175 @@
+"""
+Async Transfer Calculator
+
+An asyncio facade over the transfer calculations for use inside event-loop services.
+Batches are split into chunks and run on a configurable executor so the loop never blocks.
+"""
+import asyncio
+import collections
+import functools
+import math
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence
+
+from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time, TransferPair
+
+DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_MAX_PENDING = 4
+
+_DONE = object()
+
+
+def _phase_angle_chunk(queries: Sequence[tuple]) -> list[float]:
+    return [phase_angle(planet1, planet2, t) for planet1, planet2, t in queries]
+
+
+def _transfer_window_chunk(queries: Sequence[tuple]) -> list[float]:
+    return [transfer_window_time(planet1, planet2, target_phase) for planet1, planet2, target_phase in queries]
+
+
+def _hohmann_chunk(pairs: Sequence[tuple]) -> list[float]:
+    return [hohmann_transfer_time(planet1, planet2) for planet1, planet2 in pairs]
+
+
+def _window_chunk(pair: TransferPair, k_start: int, k_stop: int) -> list[float]:
+    return [pair.window(k) for k in range(k_start, k_stop)]
+
+
+class AsyncTransferCalculator:
+    """
+    Awaitable batch and streaming API over the transfer calculator functions.
+
+    Work runs on ``executor`` (the loop's default thread pool when None). For CPU-heavy
+    batches pass a ``ProcessPoolExecutor``; planets and pairs are picklable.
+    At most ``max_pending`` chunks are in flight at once and streamed results are
+    buffered in a queue of the same size, so slow consumers throttle the producer.
+    """
+    def __init__(self, executor: Optional[Executor] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        if max_pending <= 0:
+            raise ValueError("Max pending must be positive.")
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+
+    async def phase_angles(self, queries: Iterable[tuple]) -> list[float]:
+        """
+        Calculate phase angles for many (planet1, planet2, t) queries.
+
+        :param queries: Iterable of (planet1, planet2, time in seconds) tuples
+        :return: List of phase angles in degrees, in query order
+        """
+        return [value async for value in self.iter_phase_angles(queries)]
+
+    async def transfer_window_times(self, queries: Iterable[tuple]) -> list[float]:
+        """
+        Calculate transfer window times for many (planet1, planet2, target_phase) queries.
+
+        :param queries: Iterable of (planet1, planet2, target phase in degrees) tuples
+        :return: List of times in seconds, in query order
+        """
+        chunks = ((_transfer_window_chunk, chunk) for chunk in self._chunked(queries))
+        return [value async for value in self._stream(chunks)]
+
+    async def hohmann_transfer_times(self, pairs: Iterable[tuple]) -> list[float]:
+        """
+        Calculate Hohmann transfer times for many (planet1, planet2) pairs.
+
+        :param pairs: Iterable of (planet1, planet2) tuples
+        :return: List of transfer times in seconds, in pair order
+        """
+        chunks = ((_hohmann_chunk, chunk) for chunk in self._chunked(pairs))
+        return [value async for value in self._stream(chunks)]
+
+    async def iter_phase_angles(self, queries: Iterable[tuple]) -> AsyncIterator[float]:
+        """
+        Stream phase angles for many (planet1, planet2, t) queries as chunks complete.
+
+        :param queries: Iterable of (planet1, planet2, time in seconds) tuples
+        :return: Async iterator of phase angles in degrees, in query order
+        """
+        chunks = ((_phase_angle_chunk, chunk) for chunk in self._chunked(queries))
+        async for value in self._stream(chunks):
+            yield value
+
+    async def iter_windows(self, planet1, planet2, end: float, target_phase: float = 0,
+                           start: float = 0) -> AsyncIterator[float]:
+        """
+        Stream every transfer window time in [start, end].
+
+        :param planet1: Planet object for the departure planet
+        :param planet2: Planet object for the arrival planet
+        :param end: End of the horizon in seconds
+        :param target_phase: Target phase angle in degrees
+        :param start: Start of the horizon in seconds
+        :return: Async iterator of window times in seconds
+        """
+        pair = TransferPair(planet1, planet2, target_phase)
+        first = pair.next_window(start)
+        if first > end:
+            return
+        k_start = round((first - pair.first_window) / pair.synodic_period)
+        k_stop = k_start + math.floor((end - first) / pair.synodic_period) + 1
+        chunks = ((_window_chunk, (pair, k, min(k + self.chunk_size, k_stop)))
+                  for k in range(k_start, k_stop, self.chunk_size))
+        async for value in self._stream(chunks, unpack=True):
+            yield value
+
+    def _chunked(self, items: Iterable[Any]) -> Iterable[list]:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def _stream(self, chunks: Iterable[tuple[Callable, Any]], unpack: bool = False) -> AsyncIterator[Any]:
+        """
+        Run chunks on the executor and yield their results in order.
+
+        A producer task keeps up to ``max_pending`` chunks in flight and feeds a bounded
+        queue; closing or cancelling the consumer cancels the producer.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+
+        async def produce() -> None:
+            in_flight: collections.deque = collections.deque()
+            try:
+                for func, args in chunks:
+                    call = functools.partial(func, *args) if unpack else functools.partial(func, args)
+                    in_flight.append(loop.run_in_executor(self.executor, call))
+                    if len(in_flight) >= self.max_pending:
+                        await queue.put(await in_flight.popleft())
+                while in_flight:
+                    await queue.put(await in_flight.popleft())
+                await queue.put(_DONE)
+            except asyncio.CancelledError:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in in_flight:
+                    future.cancel()
+                await queue.put(e)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                for value in item:
+                    yield value
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,78 @@
+"""
+Benchmark comparing bulk 3D (plane change) transfer costs and windows against the coplanar 2D path.
+
+Run from the repository root:
+    python benchmarks/bench_plane_change.py
+"""
+import os
+import random
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from planet import Planet
+from plane_change import InclinedTransfers, G
+from windows import batch_window_intervals
+from events import phase_parameters
+
+PAIRS = 1000
+EPOCHS = 200
+NUMBER = 5
+
+
+def coplanar_grid(r1: np.ndarray, r2: np.ndarray, mu: np.ndarray, phase0: np.ndarray, rate: np.ndarray,
+                  departure_times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # 2D path: phase and Hohmann delta-v for every (pair, epoch)
+    a_transfer = (r1 + r2) / 2
+    total = (np.abs(np.sqrt(mu * (2 / r1 - 1 / a_transfer)) - np.sqrt(mu / r1))
+             + np.abs(np.sqrt(mu * (2 / r2 - 1 / a_transfer)) - np.sqrt(mu / r2)))
+    phase = (phase0[:, None] + rate[:, None] * departure_times) % 360
+    return phase, np.repeat(total[:, None], departure_times.size, axis=1)
+
+
+def inclined_grid(transfers: InclinedTransfers, phase0: np.ndarray, rate: np.ndarray,
+                  departure_times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # 3D path: the same phase grid, with the plane change delta-v for every (pair, epoch)
+    phase = (phase0[:, None] + rate[:, None] * departure_times) % 360
+    return phase, transfers.delta_v(departure_times)
+
+
+def coplanar_windows(planets1, planets2, coplanar_cost: np.ndarray, t_end: float) -> tuple:
+    # 2D path for windows: phase windows priced with the coplanar Hohmann delta-v
+    index, times, _ = batch_window_intervals(planets1, planets2, 0, t_end)
+    return index, times, coplanar_cost[index]
+
+
+def main() -> None:
+    random.seed(0)
+    earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+    targets = [Planet(str(k), random.uniform(2e11, 8e11), 1e20, 1.989e30, random.uniform(0, 360),
+                      random.uniform(0, 20), random.uniform(0, 360)) for k in range(PAIRS)]
+    horizon = 30 * 365.25 * 86400
+    departure_times = np.linspace(0, horizon, EPOCHS)
+
+    transfers = InclinedTransfers([earth] * PAIRS, targets)
+    r1 = np.full(PAIRS, earth.a)
+    r2 = np.array([p.a for p in targets])
+    mu = np.full(PAIRS, G * earth.M)
+
+    phase0, rate = phase_parameters([earth] * PAIRS, targets)
+
+    t_2d = timeit.timeit(lambda: coplanar_grid(r1, r2, mu, phase0, rate, departure_times), number=NUMBER) / NUMBER
+    t_3d = timeit.timeit(lambda: inclined_grid(transfers, phase0, rate, departure_times), number=NUMBER) / NUMBER
+    print(f"Grid     {PAIRS} pairs x {EPOCHS} epochs  2D: {t_2d * 1e3:7.2f} ms  3D: {t_3d * 1e3:7.2f} ms  "
+          f"ratio: {t_3d / t_2d:4.1f}x")
+
+    planets1 = [earth] * PAIRS
+    t_2d = timeit.timeit(lambda: coplanar_windows(planets1, targets, transfers.coplanar_delta_v, horizon),
+                         number=NUMBER) / NUMBER
+    t_3d = timeit.timeit(lambda: transfers.windows(horizon), number=NUMBER) / NUMBER
+    print(f"Windows  {PAIRS} pairs x 30 years       2D: {t_2d * 1e3:7.2f} ms  3D: {t_3d * 1e3:7.2f} ms  "
+          f"ratio: {t_3d / t_2d:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Microbenchmark comparing per-query cost of TransferPair against the free functions.
+
+Run from the repository root:
+    python benchmarks/bench_transfer_pair.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from planet import Planet
+from transfer_calculator import phase_angle, transfer_window_time, TransferPair
+
+NUMBER = 200000
+
+
+def main() -> None:
+    earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+    mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 44.0)
+    pair = TransferPair(earth, mars)
+
+    cases = [
+        ("phase at t", lambda: phase_angle(earth, mars, 86400.0), lambda: pair.phase_at(86400.0)),
+        ("next window", lambda: transfer_window_time(earth, mars), lambda: pair.next_window(86400.0)),
+    ]
+    for label, free, fused in cases:
+        t_free = timeit.timeit(free, number=NUMBER) / NUMBER
+        t_fused = timeit.timeit(fused, number=NUMBER) / NUMBER
+        print(f"{label:12s}  free: {t_free * 1e9:8.1f} ns  pair: {t_fused * 1e9:8.1f} ns  speedup: {t_free / t_fused:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmark of bulk column validation on 10^6 string rows.
+
+Run from the repository root:
+    python benchmarks/bench_validation.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from validation import validate_columns, POSITIVE, ANGLE_DEGREES
+
+ROWS = 10**6
+NUMBER = 3
+
+
+def main() -> None:
+    masses = [str(k + 1) for k in range(ROWS)]
+    angles = [str(k % 361) for k in range(ROWS)]
+    masses[ROWS // 2] = "oops"
+    angles[ROWS // 3] = "-1"
+    columns = {"Mass": masses, "Initial Mean Anomaly": angles}
+    rules = {"Mass": POSITIVE, "Initial Mean Anomaly": ANGLE_DEGREES}
+
+    _, report = validate_columns(columns, rules)
+    elapsed = timeit.timeit(lambda: validate_columns(columns, rules), number=NUMBER) / NUMBER
+    print(f"{ROWS} rows x {len(columns)} columns  {elapsed * 1e3:8.1f} ms  errors: {report.error_count}")
+
+
+if __name__ == "__main__":
+    main()
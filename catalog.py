@@ -0,0 +1,267 @@
+"""
+Body Catalog
+
+Store large numbers of small bodies as contiguous float64 arrays instead of Planet objects, and
+screen them for upcoming transfer windows from a home planet through a phase-bucket index.
+"""
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+from planet import Planet
+
+G = 6.67430e-11  # Gravitational constant
+TWO_PI = 2 * math.pi
+DEFAULT_RATE_BUCKETS = 64
+KEY_MARGIN = 1e-9  # Radians of slack so rounding never drops a body at a bucket slice edge
+
+# Row layout of the catalog array
+ROW_A, ROW_M, ROW_THETA0, ROW_N = range(4)
+ROW_COUNT = 4
+
+
+class BodyCatalog:
+    """
+    A catalog of bodies stored as a (4, N) float64 array.
+
+    Rows hold the semi-major axis (m), central body mass (kg), initial mean anomaly (rad) and
+    the derived mean motion (rad/s), so each column of parameters is contiguous in memory.
+    """
+    def __init__(self, data: np.ndarray) -> None:
+        """
+        Initialize a BodyCatalog object.
+
+        :param data: Array of shape (4, N) in the catalog row layout (may be memory-mapped)
+        """
+        if data.ndim != 2 or data.shape[0] != ROW_COUNT:
+            raise ValueError(f"Catalog data must have shape ({ROW_COUNT}, N).")
+        self.data = data
+
+    @classmethod
+    def from_arrays(cls, semi_major_axis, central_mass, initial_mean_anomaly) -> "BodyCatalog":
+        """
+        Build a catalog from parameter arrays.
+
+        :param semi_major_axis: Semi-major axes in meters
+        :param central_mass: Central body masses in kg (scalar or array)
+        :param initial_mean_anomaly: Initial mean anomalies in degrees
+        :return: BodyCatalog
+        """
+        a = np.asarray(semi_major_axis, dtype=np.float64)
+        if np.any(a <= 0):
+            raise ValueError("Semi-major axis must be positive.")
+        central = np.broadcast_to(np.asarray(central_mass, dtype=np.float64), a.shape)
+        if np.any(central <= 0):
+            raise ValueError("Central body mass must be positive.")
+        data = np.empty((ROW_COUNT, a.size), dtype=np.float64)
+        data[ROW_A] = a
+        data[ROW_M] = central
+        data[ROW_THETA0] = np.radians(initial_mean_anomaly)
+        data[ROW_N] = np.sqrt(G * central / a ** 3)
+        return cls(data)
+
+    @classmethod
+    def from_planets(cls, planets: Sequence[Planet]) -> "BodyCatalog":
+        """
+        Build a catalog from Planet objects.
+
+        :param planets: Planet objects
+        :return: BodyCatalog
+        """
+        return cls.from_arrays([p.a for p in planets], [p.M for p in planets],
+                               [math.degrees(p.theta0) for p in planets])
+
+    def save(self, path: str) -> None:
+        """
+        Save the catalog as a .npy file.
+
+        :param path: Destination file path
+        """
+        np.save(path, self.data)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "BodyCatalog":
+        """
+        Load a catalog saved with save.
+
+        :param path: Catalog file path
+        :param mmap: Memory-map the file read-only instead of reading it into memory
+        :return: BodyCatalog
+        """
+        return cls(np.load(path, mmap_mode="r" if mmap else None))
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def a(self) -> np.ndarray:
+        return self.data[ROW_A]
+
+    @property
+    def M(self) -> np.ndarray:
+        return self.data[ROW_M]
+
+    @property
+    def theta0(self) -> np.ndarray:
+        return self.data[ROW_THETA0]
+
+    @property
+    def n(self) -> np.ndarray:
+        return self.data[ROW_N]
+
+    def planet(self, index: int, name: Optional[str] = None) -> Planet:
+        """
+        Create a Planet object for one catalog entry.
+
+        :param index: Index of the body
+        :param name: Name of the planet (defaults to the index)
+        :return: Planet object (mass is not stored in the catalog and is set to 0)
+        """
+        return Planet(name if name is not None else str(index), float(self.a[index]), 0.0,
+                      float(self.M[index]), math.degrees(self.theta0[index]))
+
+    def next_windows(self, home: Planet, target_phase: float = 0, t: float = 0) -> np.ndarray:
+        """
+        Calculate the next transfer window from the home planet to every body, without an index.
+
+        :param home: Planet object for the departure planet
+        :param target_phase: Target phase angle in degrees
+        :param t: Time in seconds from which to look for windows
+        :return: Array of window times in seconds (inf for bodies co-orbital with the home planet)
+        """
+        rate = self.n - 2 * math.pi / home.orbital_period()
+        return t + _time_to_target(self.theta0 - home.theta0, rate, math.radians(target_phase), t)
+
+    def build_index(self, home: Planet, rate_buckets: int = DEFAULT_RATE_BUCKETS, epoch: float = 0) -> "PhaseIndex":
+        """
+        Build a phase-bucket index of the catalog relative to a home planet.
+
+        :param home: Planet object for the departure planet
+        :param rate_buckets: Approximate number of relative phase rate buckets
+        :param epoch: Time in seconds at which the phase keys are taken (queries near it prune best)
+        :return: PhaseIndex
+        """
+        return PhaseIndex(self, home, rate_buckets, epoch)
+
+
+def _time_to_target(phase0: np.ndarray, rate: np.ndarray, target: float, t: float) -> np.ndarray:
+    """
+    Time from t until phase0 + rate * t next reaches target, moving in the direction of rate (radians).
+    """
+    sign = np.where(rate < 0, -1.0, 1.0)
+    distance = (sign * (target - phase0 - rate * t)) % TWO_PI
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rate != 0, distance / np.abs(rate), math.inf)
+
+
+class PhaseIndex:
+    """
+    Catalog bodies bucketed by relative phase rate, sorted by phase offset within each bucket.
+
+    Buckets never mix prograde and retrograde relative motion. Within a bucket, bodies are
+    sorted by their phase at the key epoch. For a query, each bucket's rate bounds give the
+    range of keys that can reach the target within the horizon, so only that slice of the
+    bucket is checked exactly. The slice widens by the bucket's rate spread times the distance
+    between the query and the key epoch, so for queries far from it call rekey() first.
+    """
+    def __init__(self, catalog: BodyCatalog, home: Planet, rate_buckets: int = DEFAULT_RATE_BUCKETS,
+                 epoch: float = 0) -> None:
+        """
+        Initialize a PhaseIndex object.
+
+        :param catalog: BodyCatalog to index
+        :param home: Planet object for the departure planet
+        :param rate_buckets: Approximate number of relative phase rate buckets
+        :param epoch: Time in seconds at which the phase keys are taken
+        """
+        if rate_buckets <= 0:
+            raise ValueError("Number of rate buckets must be positive.")
+        self.catalog = catalog
+        self.home = home
+        self.rate = np.asarray(catalog.n) - 2 * math.pi / home.orbital_period()
+        self.offset = (np.asarray(catalog.theta0) - home.theta0) % TWO_PI
+
+        by_rate = np.argsort(self.rate, kind="stable")
+        split = int(np.searchsorted(self.rate[by_rate], 0.0))  # Retrograde bodies come first
+        per_bucket = max(1, math.ceil(len(catalog) / rate_buckets))
+        boundaries = sorted({0, split, len(catalog)} | set(range(0, split, per_bucket))
+                            | set(range(split, len(catalog), per_bucket)))
+
+        self.bucket_start = np.array(boundaries, dtype=np.int64)
+        self.bucket_sign = np.empty(len(boundaries) - 1)
+        self.bucket_rate_min = np.empty(len(boundaries) - 1)
+        self.bucket_rate_max = np.empty(len(boundaries) - 1)
+        self.order = by_rate.astype(np.int64)
+        self.keys = np.empty(len(catalog))
+        for b, (start, stop) in enumerate(zip(boundaries[:-1], boundaries[1:])):
+            speed = np.abs(self.rate[by_rate[start:stop]])
+            self.bucket_sign[b] = -1.0 if start < split else 1.0
+            self.bucket_rate_min[b] = speed.min()
+            self.bucket_rate_max[b] = speed.max()
+        self.rekey(epoch)
+
+    def rekey(self, epoch: float) -> None:
+        """
+        Re-sort every bucket by phase at a new key epoch; the buckets themselves are unchanged.
+
+        :param epoch: Time in seconds at which the phase keys are taken
+        """
+        self.epoch = epoch
+        for b in range(self.bucket_sign.size):
+            start, stop = self.bucket_start[b], self.bucket_start[b + 1]
+            members = self.order[start:stop]
+            # Phases at the epoch, measured in the direction of relative motion
+            keys = (self.bucket_sign[b] * (self.offset[members] + self.rate[members] * epoch)) % TWO_PI
+            sort = np.argsort(keys, kind="stable")
+            self.order[start:stop] = members[sort]
+            self.keys[start:stop] = keys[sort]
+
+    def candidates(self, horizon: float, target_phase: float = 0, t: float = 0) -> np.ndarray:
+        """
+        Select bodies that may have a window in [t, t + horizon], touching only matching bucket slices.
+
+        :param horizon: Length of the search horizon in seconds
+        :param target_phase: Target phase angle in degrees
+        :param t: Start of the search horizon in seconds
+        :return: Array of candidate body indices (a superset of the bodies with a window)
+        """
+        target = math.radians(target_phase)
+        elapsed = (t - self.epoch, t - self.epoch + horizon)
+        selected = []
+        for b in range(self.bucket_sign.size):
+            start, stop = self.bucket_start[b], self.bucket_start[b + 1]
+            # A key k reaches the target when k + speed * x = target for some x in elapsed, so the
+            # keys lie in target - [min, max] of speed * x over the bucket's speeds (mod 2 pi)
+            advance = [speed * x for speed in (self.bucket_rate_min[b], self.bucket_rate_max[b]) for x in elapsed]
+            width = max(advance) - min(advance) + 2 * KEY_MARGIN
+            if width >= TWO_PI:
+                selected.append(self.order[start:stop])
+                continue
+            hi = (self.bucket_sign[b] * target - min(advance) + KEY_MARGIN) % TWO_PI
+            lo = hi - width
+            keys = self.keys[start:stop]
+            ranges = [(lo, hi)] if lo >= 0 else [(0.0, hi), (lo + TWO_PI, TWO_PI)]
+            for range_lo, range_hi in ranges:
+                first = start + np.searchsorted(keys, range_lo, side="left")
+                last = start + np.searchsorted(keys, range_hi, side="right")
+                selected.append(self.order[first:last])
+        return np.concatenate(selected) if selected else np.empty(0, dtype=np.int64)
+
+    def query(self, horizon: float, target_phase: float = 0, t: float = 0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the bodies with a transfer window from the home planet in [t, t + horizon].
+
+        :param horizon: Length of the search horizon in seconds
+        :param target_phase: Target phase angle in degrees
+        :param t: Start of the search horizon in seconds
+        :return: Tuple of (body index array, next window time array), sorted by window time
+        """
+        if horizon < 0:
+            raise ValueError("Horizon must be non-negative.")
+        bodies = self.candidates(horizon, target_phase, t)
+        wait = _time_to_target(self.offset[bodies], self.rate[bodies], math.radians(target_phase), t)
+        hits = wait <= horizon
+        bodies, times = bodies[hits], t + wait[hits]
+        order = np.argsort(times, kind="stable")
+        return bodies[order], times[order]
@@ -0,0 +1,142 @@
+"""
+Event Detection
+
+Locate zero crossings of many scalar functions of time at once. Every function is sampled on a
+coarse grid in one vectorized pass, sign changes are bracketed, and all brackets are refined
+together with the Illinois variant of regula falsi. Transfer windows are the zero crossings of
+(phase - target), which keeps working once the phase no longer changes linearly.
+"""
+import math
+from typing import Callable, Sequence, Union
+
+import numpy as np
+
+from transfer_calculator import phase_angle
+
+DEFAULT_SAMPLES_PER_PERIOD = 8
+DEFAULT_TOLERANCE = 1e-3  # Seconds
+DEFAULT_MAX_ITERATIONS = 100
+
+
+def find_events(func: Callable[[np.ndarray, np.ndarray], np.ndarray], count: int, t_start: float, t_end: float,
+                step: Union[float, np.ndarray], max_jump: float = math.inf, tolerance: float = DEFAULT_TOLERANCE,
+                max_iterations: int = DEFAULT_MAX_ITERATIONS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find every zero crossing of ``count`` functions in [t_start, t_end].
+
+    ``func(index, t)`` evaluates function ``index`` at time ``t`` elementwise over broadcast arrays.
+    The sampling step must be small enough that no function crosses zero twice within one step.
+
+    :param func: Vectorized function of (function index array, time array)
+    :param count: Number of functions
+    :param t_start: Start of the horizon in seconds
+    :param t_end: End of the horizon in seconds
+    :param step: Sampling step in seconds, scalar or one per function
+    :param max_jump: Sign changes with a larger jump between samples are treated as discontinuities, not roots
+    :param tolerance: Bracket width in seconds at which refinement stops
+    :param max_iterations: Maximum refinement iterations
+    :return: Tuple of (function index array, event time array), sorted by index then time
+    """
+    if t_end < t_start:
+        raise ValueError("End of the horizon must not be before its start.")
+    step = np.broadcast_to(np.asarray(step, dtype=np.float64), (count,))
+    if np.any(step <= 0):
+        raise ValueError("Sampling step must be positive.")
+    if count == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    # Per-function grids that land exactly on t_end; samples past a function's grid are masked
+    intervals = np.maximum(np.ceil((t_end - t_start) / step), 1).astype(np.int64)
+    width = (t_end - t_start) / intervals
+    k = np.arange(intervals.max() + 1)
+    in_grid = k[None, :] <= intervals[:, None]
+    times = np.where(in_grid, t_start + width[:, None] * k[None, :], t_end)
+    index = np.broadcast_to(np.arange(count)[:, None], times.shape)
+    values = func(index, times)
+
+    left, right = values[:, :-1], values[:, 1:]
+    segment = in_grid[:, 1:]
+    crossing = segment & (np.abs(right - left) <= max_jump) & (left * right < 0)
+    exact = segment & (left == 0)
+    last = values[np.arange(count), intervals] == 0
+
+    bracket_index, bracket_k = np.nonzero(crossing)
+    exact_index, exact_k = np.nonzero(exact)
+    last_index = np.flatnonzero(last)
+    refined = _illinois(func, bracket_index,
+                        times[bracket_index, bracket_k], times[bracket_index, bracket_k + 1],
+                        left[bracket_index, bracket_k], right[bracket_index, bracket_k],
+                        tolerance, max_iterations)
+    event_index = np.concatenate([bracket_index, exact_index, last_index])
+    event_times = np.concatenate([refined, times[exact_index, exact_k], np.full(last_index.size, t_end)])
+    order = np.lexsort((event_times, event_index))
+    return event_index[order], event_times[order]
+
+
+def _illinois(func: Callable, index: np.ndarray, a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+              tolerance: float, max_iterations: int) -> np.ndarray:
+    """
+    Refine all brackets [a, b] with f(a) * f(b) < 0 together; converged brackets drop out of the active set.
+    """
+    a, b, fa, fb = a.copy(), b.copy(), fa.copy(), fb.copy()
+    active = np.arange(a.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        aa, bb, ffa, ffb = a[active], b[active], fa[active], fb[active]
+        c = (aa * ffb - bb * ffa) / (ffb - ffa)
+        fc = func(index[active], c)
+
+        flip = fc * ffb < 0
+        aa = np.where(flip, bb, aa)
+        ffa = np.where(flip, ffb, ffa / 2)
+        a[active], fa[active], b[active], fb[active] = aa, ffa, c, fc
+
+        active = active[(np.abs(c - aa) > tolerance) & (fc != 0)]
+    return b
+
+
+def phase_parameters(planets1: Sequence, planets2: Sequence) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the initial phase and phase rate of many planet pairs.
+
+    :param planets1: Planet objects for the departure planets
+    :param planets2: Planet objects for the arrival planets
+    :return: Tuple of (phase at t = 0 in degrees, phase rate in degrees per second) arrays
+    """
+    if len(planets1) != len(planets2):
+        raise ValueError("Departure and arrival planet lists must have the same length.")
+    phase0 = np.array([phase_angle(p1, p2, 0) for p1, p2 in zip(planets1, planets2)], dtype=np.float64)
+    rate = np.array([math.degrees(2 * math.pi / p2.orbital_period() - 2 * math.pi / p1.orbital_period())
+                     for p1, p2 in zip(planets1, planets2)], dtype=np.float64)
+    return phase0, rate
+
+
+def find_transfer_windows(planets1: Sequence, planets2: Sequence, t_end: float, target_phase: float = 0,
+                          t_start: float = 0, samples_per_period: int = DEFAULT_SAMPLES_PER_PERIOD,
+                          tolerance: float = DEFAULT_TOLERANCE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find every transfer window in [t_start, t_end] for many planet pairs.
+
+    :param planets1: Planet objects for the departure planets
+    :param planets2: Planet objects for the arrival planets
+    :param t_end: End of the horizon in seconds
+    :param target_phase: Target phase angle in degrees
+    :param t_start: Start of the horizon in seconds
+    :param samples_per_period: Coarse samples per synodic period of each pair (at least 3)
+    :param tolerance: Accuracy of the window times in seconds
+    :return: Tuple of (pair index array, window time array), sorted by pair then time
+    """
+    if samples_per_period < 3:
+        # Fewer samples move the phase by 180 degrees or more per step, which cannot be bracketed
+        raise ValueError("At least 3 samples per synodic period are required.")
+    phase0, rate = phase_parameters(planets1, planets2)
+    if np.any(np.abs(rate) < math.degrees(1e-10)):
+        raise ValueError("Planets have nearly identical orbital periods; transfer window calculation not applicable.")
+
+    def offset(index: np.ndarray, t: np.ndarray) -> np.ndarray:
+        # Phase minus target, wrapped to [-180, 180)
+        return (phase0[index] + rate[index] * t - target_phase + 180) % 360 - 180
+
+    step = 360 / np.abs(rate) / samples_per_period
+    return find_events(offset, len(phase0), t_start, t_end, step, max_jump=180, tolerance=tolerance)
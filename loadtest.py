@@ -0,0 +1,252 @@
+"""
+Load Test
+
+Replay a recorded workload (or a synthetic one) against the core library, a command-line program
+or a local HTTP service at a target request rate, and report throughput against the target,
+latency percentiles and the memory high-water mark.
+
+Examples:
+    python loadtest.py --log workload.twl --rate 500
+    python loadtest.py --synthetic 10000 --target http --url http://127.0.0.1:8000/calculate
+    python loadtest.py --synthetic 100 --target command --command "mytool {a1} {a2} {time}"
+"""
+import argparse
+import json
+import math
+import random
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Sequence
+
+from workload import INPUT_FIELDS, read_workload, run_request
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+AU = 149597870700
+DAYS_TO_SECONDS = 24 * 3600
+SUN_MASS = 1.989e30
+# Achieved rates below this fraction of the target are flagged in the report
+RATE_SHORTFALL = 0.95
+
+
+def synthetic_workload(count: int, seed: Optional[int] = None) -> list[tuple]:
+    """
+    Generate random but valid requests.
+
+    :param count: Number of requests
+    :param seed: Random seed for reproducible workloads
+    :return: List of normalized inputs in INPUT_FIELDS order
+    """
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(count):
+        a1 = rng.uniform(0.3, 2.0) * AU
+        a2 = a1 * rng.uniform(1.1, 15.0)
+        workload.append((a1, rng.uniform(1e22, 1e26), rng.uniform(0, 360),
+                         a2, rng.uniform(1e22, 1e27), rng.uniform(0, 360),
+                         SUN_MASS, rng.uniform(0, 3650) * DAYS_TO_SECONDS))
+    return workload
+
+
+def recorded_workload(path: str, include_failed: bool = False) -> list[tuple]:
+    """
+    Load the inputs of a recorded workload.
+
+    :param path: Workload log path
+    :param include_failed: Also replay requests that failed when recorded (if their inputs were parsed)
+    :return: List of normalized inputs in INPUT_FIELDS order
+    """
+    return [record.inputs for record in read_workload(path)
+            if (record.ok or include_failed) and not any(math.isnan(value) for value in record.inputs)]
+
+
+def command_driver(template: str) -> Callable[[Sequence[float]], None]:
+    """
+    :param template: Command line with {field} placeholders for the INPUT_FIELDS
+    """
+    def drive(inputs: Sequence[float]) -> None:
+        command = template.format(**dict(zip(INPUT_FIELDS, inputs)))
+        subprocess.run(shlex.split(command), check=True, stdout=subprocess.DEVNULL)
+    return drive
+
+
+def http_driver(url: str, timeout: float = 10.0) -> Callable[[Sequence[float]], None]:
+    """
+    :param url: Endpoint receiving each request as a JSON object keyed by the INPUT_FIELDS
+    """
+    def drive(inputs: Sequence[float]) -> None:
+        body = json.dumps(dict(zip(INPUT_FIELDS, inputs))).encode()
+        request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    return drive
+
+
+def _max_rss_bytes(who: str) -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class LoadTestReport:
+    """
+    Results of a load test run.
+    """
+    def __init__(self, latencies: list[float], errors: int, elapsed: float,
+                 max_rss: Optional[int], children_max_rss: Optional[int], target_rate: float = 0) -> None:
+        self.latencies = latencies
+        self.errors = errors
+        self.elapsed = elapsed
+        self.max_rss = max_rss
+        self.children_max_rss = children_max_rss
+        self.target_rate = target_rate
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def below_target(self) -> bool:
+        """
+        :return: True if a target rate was set and the achieved throughput fell short of it
+        """
+        return self.target_rate > 0 and self.throughput < RATE_SHORTFALL * self.target_rate
+
+    def percentile(self, p: float) -> float:
+        """
+        :param p: Percentile between 0 and 100
+        :return: Latency at that percentile in seconds
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+    def summary(self) -> str:
+        lines = [
+            f"Requests:     {self.requests} ({self.errors} errors)",
+            f"Elapsed:      {self.elapsed:.3f} s",
+            f"Throughput:   {self.throughput:.1f} req/s",
+        ]
+        if self.target_rate > 0:
+            lines.append(f"Target rate:  {self.target_rate:.1f} req/s")
+            if self.below_target:
+                lines.append("WARNING:      target rate not reached; latencies include time spent queued")
+        if self.latencies:
+            lines.append(f"Latency mean: {statistics.fmean(self.latencies) * 1e3:.3f} ms")
+            for p in (50, 90, 99):
+                lines.append(f"Latency p{p}:  {self.percentile(p) * 1e3:.3f} ms")
+            lines.append(f"Latency max:  {max(self.latencies) * 1e3:.3f} ms")
+        if self.max_rss is not None:
+            lines.append(f"Max RSS:      {self.max_rss / 2**20:.1f} MiB")
+        if self.children_max_rss:
+            lines.append(f"Child max RSS: {self.children_max_rss / 2**20:.1f} MiB")
+        return "\n".join(lines)
+
+
+def replay(workload: Iterable[Sequence[float]], driver: Callable[[Sequence[float]], None],
+           rate: float = 0, workers: int = 1) -> LoadTestReport:
+    """
+    Drive requests on a fixed schedule and measure each latency from its scheduled send time.
+
+    Request k is due at start + k / rate. With one worker requests run one after another, so
+    when the target cannot keep up the schedule slips and the queueing delay is counted in
+    the latencies; with more workers requests are dispatched to a thread pool on schedule, up
+    to that many in flight. Either way the report shows the target next to the achieved rate.
+    Without a target rate there is no schedule: each latency is timed from when a worker
+    actually sends the request, so time waiting in the pool is not counted.
+
+    :param workload: Normalized inputs in INPUT_FIELDS order
+    :param driver: Callable running one request
+    :param rate: Target requests per second (0 for as fast as possible)
+    :param workers: Number of requests that may be in flight at once
+    :return: LoadTestReport
+    """
+    if workers < 1:
+        raise ValueError("At least one worker is required.")
+    interval = 1 / rate if rate > 0 else 0.0
+
+    def run(inputs: Sequence[float], scheduled: Optional[float]) -> tuple[float, bool]:
+        sent = time.perf_counter()
+        try:
+            driver(inputs)
+            ok = True
+        except Exception:
+            ok = False
+        return time.perf_counter() - (sent if scheduled is None else scheduled), ok
+
+    def due(k: int) -> Optional[float]:
+        if not interval:
+            return None
+        scheduled = start + k * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return scheduled
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [run(inputs, due(k)) for k, inputs in enumerate(workload)]
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            futures = [pool.submit(run, inputs, due(k)) for k, inputs in enumerate(workload)]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in results]
+    errors = sum(not ok for _, ok in results)
+    return LoadTestReport(latencies, errors, elapsed, _max_rss_bytes("RUSAGE_SELF"), _max_rss_bytes("RUSAGE_CHILDREN"),
+                          rate)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a transfer calculator workload and report performance.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--log", help="Workload log recorded with TWC_WORKLOAD_LOG")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Generate N random requests")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for synthetic workloads")
+    parser.add_argument("--include-failed", action="store_true", help="Also replay requests that failed when recorded")
+    parser.add_argument("--target", choices=("core", "command", "http"), default="core")
+    parser.add_argument("--command", help="Command template for --target command, with {field} placeholders")
+    parser.add_argument("--url", help="Endpoint for --target http")
+    parser.add_argument("--rate", type=float, default=0, help="Target requests per second (0 for unthrottled)")
+    parser.add_argument("--workers", type=int, default=1, help="Requests that may be in flight at once")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the workload this many times")
+    args = parser.parse_args(argv)
+
+    if args.target == "command" and not args.command:
+        parser.error("--target command requires --command")
+    if args.target == "http" and not args.url:
+        parser.error("--target http requires --url")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    workload = recorded_workload(args.log, args.include_failed) if args.log else synthetic_workload(args.synthetic, args.seed)
+    if args.target == "core":
+        driver = run_request
+    elif args.target == "command":
+        driver = command_driver(args.command)
+    else:
+        driver = http_driver(args.url)
+
+    report = replay(workload * args.repeat, driver, args.rate, args.workers)
+    print(report.summary())
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
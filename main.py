@@ -7,9 +7,12 @@ import customtkinter as ctk
 from tkinter import messagebox
 import math
 import logging
+import time
 from typing import Optional
 from planet import Planet
 from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time
+from validation import validate_value, POSITIVE, NON_NEGATIVE, ANGLE_DEGREES
+from workload import WorkloadRecorder, default_log_path
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
@@ -31,14 +34,14 @@ DEFAULT_TIME_DAYS = 0.0
 
 KM_TO_M = 1000
 DAYS_TO_SECONDS = 24 * 3600
-PHASE_ANGLE_MAX = 360
 
 class TransferWindowCalculator:
     """
     A GUI application for calculating transfer windows between two planets.
     """
-    def __init__(self, root: ctk.CTk) -> None:
+    def __init__(self, root: ctk.CTk, recorder: Optional[WorkloadRecorder] = None) -> None:
         self.root = root
+        self.recorder = recorder
         self.root.title("Transfer Window Calculator")
         self.root.geometry("800x600")
 
@@ -211,6 +214,8 @@ class TransferWindowCalculator:
         """
         Perform the transfer window calculations and update the output labels.
         """
+        start = time.perf_counter()
+        inputs = None
         try:
             # Validate and get inputs
             planet1_data = self._get_planet_data(1)
@@ -220,6 +225,8 @@ class TransferWindowCalculator:
                 raise ValueError("Time days entry is not initialized.")
             time_days = self._get_non_negative_float(self.time_days, "Time (days)")
             time_seconds = time_days * DAYS_TO_SECONDS
+            inputs = (planet1_data[1], planet1_data[2], planet1_data[3], planet2_data[1], planet2_data[2],
+                      planet2_data[3], central_mass, time_seconds)
 
             # Create planets
             planet1 = Planet(planet1_data[0], planet1_data[1], planet1_data[2], central_mass, planet1_data[3])
@@ -236,11 +243,31 @@ class TransferWindowCalculator:
             self.hohmann_time_label.configure(text=f"Hohmann Transfer Time: {hohmann_t / DAYS_TO_SECONDS:.2f} days")
 
         except ValueError as e:
+            self._record_request(inputs, start, False)
             self.logger.error(f"Input error: {str(e)}")
             messagebox.showerror("Input Error", str(e))
         except Exception as e:
+            self._record_request(inputs, start, False)
             self.logger.error(f"Calculation error: {str(e)}")
             messagebox.showerror("Calculation Error", f"An unexpected error occurred: {str(e)}")
+        else:
+            # Only once the outputs are updated; errors here are not caught by the handlers above
+            self._record_request(inputs, start, True)
+
+    def _record_request(self, inputs: Optional[tuple], start: float, ok: bool) -> None:
+        """
+        Append the request to the workload log, if recording is enabled.
+
+        :param inputs: Normalized inputs, or None if they could not be parsed
+        :param start: perf_counter value when the request started
+        :param ok: Whether the calculation succeeded
+        """
+        if self.recorder is None:
+            return
+        try:
+            self.recorder.record(inputs, time.perf_counter() - start, ok)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Workload recording error: {str(e)}")
 
     def _get_planet_data(self, planet_num: int) -> tuple[str, float, float, float]:
         """
@@ -284,13 +311,7 @@ class TransferWindowCalculator:
         """
         if entry is None:
             raise ValueError(f"{field_name} entry is not initialized.")
-        try:
-            value = float(entry.get())
-            if value <= 0:
-                raise ValueError(f"{field_name} must be positive.")
-            return value
-        except ValueError:
-            raise ValueError(f"{field_name} must be a valid positive number.")
+        return validate_value(entry.get(), POSITIVE, field_name)
 
     def _get_theta0(self, entry: Optional[ctk.CTkEntry], field_name: str) -> float:
         """
@@ -302,13 +323,7 @@ class TransferWindowCalculator:
         """
         if entry is None:
             raise ValueError(f"{field_name} entry is not initialized.")
-        try:
-            value = float(entry.get())
-            if not (0 <= value <= PHASE_ANGLE_MAX):
-                raise ValueError(f"{field_name} must be between 0 and {PHASE_ANGLE_MAX} degrees.")
-            return value
-        except ValueError:
-            raise ValueError(f"{field_name} must be a valid number between 0 and {PHASE_ANGLE_MAX}.")
+        return validate_value(entry.get(), ANGLE_DEGREES, field_name)
 
     def _get_non_negative_float(self, entry: Optional[ctk.CTkEntry], field_name: str) -> float:
         """
@@ -320,15 +335,13 @@ class TransferWindowCalculator:
         """
         if entry is None:
             raise ValueError(f"{field_name} entry is not initialized.")
-        try:
-            value = float(entry.get())
-            if value < 0:
-                raise ValueError(f"{field_name} must be non-negative.")
-            return value
-        except ValueError:
-            raise ValueError(f"{field_name} must be a valid non-negative number.")
+        return validate_value(entry.get(), NON_NEGATIVE, field_name)
 
 if __name__ == "__main__":
     root = ctk.CTk()
-    app = TransferWindowCalculator(root)
+    log_path = default_log_path()
+    recorder = WorkloadRecorder(log_path) if log_path else None
+    app = TransferWindowCalculator(root, recorder)
     root.mainloop()
+    if recorder is not None:
+        recorder.close()
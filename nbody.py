@@ -0,0 +1,203 @@
+"""
+N-Body Propagator
+
+A vectorized symplectic integrator for the central body and all planets at once, used to check
+how far the analytic (two-body, circular, unperturbed) transfer windows drift over long spans.
+"""
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+from planet import Planet
+from transfer_calculator import phase_angle
+
+G = 6.67430e-11  # Gravitational constant
+DEFAULT_STEPS_PER_ORBIT = 400
+
+# Drift (c) and kick (d) coefficients of the supported splitting schemes
+_W1 = 1 / (2 - 2 ** (1 / 3))
+_W0 = -(2 ** (1 / 3)) * _W1
+METHODS = {
+    "leapfrog": ((0.5, 0.5), (1.0,)),
+    "yoshida": ((_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2), (_W1, _W0, _W1)),
+}
+
+
+class NBodyPropagator:
+    """
+    Propagate a central body and its planets under mutual Newtonian gravity.
+
+    State is kept as (N, 3) NumPy arrays with the central body in row 0, so memory does
+    not grow with the length of the run. Planets start on circular orbits in their own
+    orbital planes at their mean longitude, matching the analytic model at t = 0.
+    """
+    def __init__(self, planets: Sequence[Planet], step: Optional[float] = None,
+                 steps_per_orbit: int = DEFAULT_STEPS_PER_ORBIT, method: str = "yoshida") -> None:
+        """
+        Initialize an NBodyPropagator object.
+
+        :param planets: Planet objects sharing the same central body mass
+        :param step: Integration step in seconds (defaults to the shortest period / steps_per_orbit)
+        :param steps_per_orbit: Steps per orbit of the innermost planet when step is not given
+        :param method: Integration scheme, "yoshida" (4th order) or "leapfrog" (2nd order)
+        """
+        if not planets:
+            raise ValueError("At least one planet is required.")
+        if method not in METHODS:
+            raise ValueError(f"Unknown integration method: {method}.")
+        central_mass = planets[0].M
+        if any(planet.M != central_mass for planet in planets):
+            raise ValueError("All planets must share the same central body mass.")
+
+        self.planets = list(planets)
+        self.method = method
+        self.t = 0.0
+        self.step = step if step is not None else min(p.orbital_period() for p in planets) / steps_per_orbit
+        if self.step <= 0:
+            raise ValueError("Integration step must be positive.")
+
+        a = np.array([p.a for p in planets])
+        direction = np.array([p.position_direction(0) for p in planets])
+        normal = np.array([p.orbit_normal() for p in planets])
+        self.masses = np.concatenate(([central_mass], [p.mass for p in planets])).astype(np.float64)
+
+        speed = np.sqrt(G * (central_mass + self.masses[1:]) / a)
+        self.positions = np.zeros((len(planets) + 1, 3))
+        self.velocities = np.zeros((len(planets) + 1, 3))
+        self.positions[1:] = a[:, None] * direction
+        self.velocities[1:] = speed[:, None] * np.cross(normal, direction)
+
+        # Move to the barycentric frame so the system does not drift
+        weights = self.masses[:, None] / self.masses.sum()
+        self.positions -= (weights * self.positions).sum(axis=0)
+        self.velocities -= (weights * self.velocities).sum(axis=0)
+
+    def _accelerations(self, positions: np.ndarray) -> np.ndarray:
+        separation = positions[None, :, :] - positions[:, None, :]
+        distance_sq = np.einsum("ijk,ijk->ij", separation, separation)
+        np.fill_diagonal(distance_sq, np.inf)
+        inv_cube = distance_sq ** -1.5
+        return G * np.einsum("ij,j,ijk->ik", inv_cube, self.masses, separation)
+
+    def _advance(self, dt: float) -> None:
+        drifts, kicks = METHODS[self.method]
+        for i, kick in enumerate(kicks):
+            self.positions += drifts[i] * dt * self.velocities
+            self.velocities += kick * dt * self._accelerations(self.positions)
+        self.positions += drifts[-1] * dt * self.velocities
+
+    def propagate_to(self, t: float) -> None:
+        """
+        Advance the state to time t using fixed steps (the last one shortened to land on t).
+
+        :param t: Target time in seconds, not earlier than the current time
+        """
+        if t < self.t:
+            raise ValueError("Cannot propagate backwards in time.")
+        full_steps = math.floor((t - self.t) / self.step)
+        for _ in range(full_steps):
+            self._advance(self.step)
+        self.t += full_steps * self.step
+        remainder = t - self.t
+        if remainder > 0:
+            self._advance(remainder)
+        self.t = t
+
+    def mean_longitudes(self) -> np.ndarray:
+        """
+        Calculate the longitude of every planet relative to the central body.
+
+        Measured like Planet.mean_longitude_at_time: the longitude of the ascending node plus the
+        argument of latitude in the planet's own orbital plane, both taken from the position and
+        angular momentum vectors. For orbits in the reference plane this is the plain polar angle.
+
+        :return: Array of longitudes in radians, one per planet
+        """
+        position = self.positions[1:] - self.positions[0]
+        momentum = np.cross(position, self.velocities[1:] - self.velocities[0])
+        # Ascending node direction z x h; undefined (and taken as the x axis) for uninclined orbits
+        node = np.stack((-momentum[:, 1], momentum[:, 0], np.zeros(len(momentum))), axis=1)
+        node_length = np.linalg.norm(node, axis=1)
+        inclined = node_length > 1e-12 * np.linalg.norm(momentum, axis=1)
+        node = np.where(inclined[:, None], node / np.where(inclined, node_length, 1)[:, None], [1.0, 0.0, 0.0])
+        normal = momentum / np.linalg.norm(momentum, axis=1)[:, None]
+
+        raan = np.arctan2(node[:, 1], node[:, 0])
+        argument_of_latitude = np.arctan2(np.sum(np.cross(node, position) * normal, axis=1),
+                                          np.sum(node * position, axis=1))
+        return raan + argument_of_latitude
+
+    def phase_angle(self, index1: int, index2: int) -> float:
+        """
+        Calculate the propagated phase angle between two planets at the current time.
+
+        :param index1: Index of the departure planet in the planets list
+        :param index2: Index of the arrival planet in the planets list
+        :return: Phase angle in degrees
+        """
+        longitudes = self.mean_longitudes()
+        return math.degrees(longitudes[index2] - longitudes[index1]) % 360
+
+    def window_discrepancies(self, index1: int, index2: int, window_times: Sequence[float]) -> np.ndarray:
+        """
+        Compare propagated and analytic phase angles at each predicted window.
+
+        :param index1: Index of the departure planet in the planets list
+        :param index2: Index of the arrival planet in the planets list
+        :param window_times: Predicted window times in seconds, in increasing order
+        :return: Array of propagated minus analytic phase angles in degrees, wrapped to [-180, 180)
+        """
+        planet1 = self.planets[index1]
+        planet2 = self.planets[index2]
+        discrepancies = np.empty(len(window_times))
+        for k, t in enumerate(window_times):
+            self.propagate_to(t)
+            difference = self.phase_angle(index1, index2) - phase_angle(planet1, planet2, t)
+            discrepancies[k] = (difference + 180) % 360 - 180
+        return discrepancies
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Save the planets, integrator settings and current state in .npz format.
+
+        :param path: Destination file path, used as given (no suffix is added)
+        """
+        # Through a file handle, so np.savez does not append .npz to paths without it
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                t=self.t,
+                step=self.step,
+                method=self.method,
+                names=np.array([p.name for p in self.planets]),
+                a=np.array([p.a for p in self.planets]),
+                mass=np.array([p.mass for p in self.planets]),
+                central_mass=self.masses[0],
+                theta0=np.array([math.degrees(p.theta0) for p in self.planets]),
+                inclination=np.array([math.degrees(p.i) for p in self.planets]),
+                raan=np.array([math.degrees(p.raan) for p in self.planets]),
+                positions=self.positions,
+                velocities=self.velocities,
+            )
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> "NBodyPropagator":
+        """
+        Restore a propagator saved with save_checkpoint.
+
+        :param path: Checkpoint file path
+        :return: NBodyPropagator positioned at the saved time and state
+        """
+        with np.load(path) as data:
+            central_mass = float(data["central_mass"])
+            planets = [
+                Planet(str(name), float(a), float(mass), central_mass, float(theta0), float(i), float(raan))
+                for name, a, mass, theta0, i, raan in zip(data["names"], data["a"], data["mass"], data["theta0"],
+                                                          data["inclination"], data["raan"])
+            ]
+            propagator = cls(planets, step=float(data["step"]), method=str(data["method"]))
+            propagator.t = float(data["t"])
+            propagator.positions = data["positions"].copy()
+            propagator.velocities = data["velocities"].copy()
+        return propagator
@@ -0,0 +1,205 @@
+"""
+Plane Change
+
+Transfer windows and delta-v between inclined circular orbits, vectorized over many planet pairs
+and departure epochs. The departure burn is a coplanar Hohmann burn aimed at the point of the target
+orbit opposite the departure point. When that point is off the node line, a broken-plane midcourse
+burn (90 degrees after departure) tilts the transfer plane about the midcourse position by the
+point's latitude above the departure plane; the arrival burn is then combined with the remaining
+plane change between the tilted transfer plane and the target orbit. Windows are the ordinary phase
+windows annotated with this cost; their times are not shifted toward node crossings.
+"""
+import math
+from typing import Sequence
+
+import numpy as np
+
+from windows import batch_window_intervals
+
+G = 6.67430e-11  # Gravitational constant
+
+
+def _orbit_axes(planets: Sequence) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :return: Tuple of (ascending node direction, direction 90 degrees along the orbit, orbit normal) arrays of shape (N, 3)
+    """
+    i = np.array([p.i for p in planets], dtype=np.float64)
+    raan = np.array([p.raan for p in planets], dtype=np.float64)
+    zero = np.zeros(i.size)
+    node = np.stack((np.cos(raan), np.sin(raan), zero), axis=-1)
+    in_plane = np.stack((-np.sin(raan) * np.cos(i), np.cos(raan) * np.cos(i), np.sin(i)), axis=-1)
+    normal = np.stack((np.sin(i) * np.sin(raan), -np.sin(i) * np.cos(raan), np.cos(i)), axis=-1)
+    return node, in_plane, normal
+
+
+class InclinedTransfers:
+    """
+    Precomputed transfer geometry for many planet pairs on inclined circular orbits.
+
+    Pair-level invariants (Hohmann speeds, transfer time, orbit normals and mutual inclination)
+    are derived once as arrays; per-epoch costs then cost a few array operations.
+    """
+    def __init__(self, planets1: Sequence, planets2: Sequence) -> None:
+        """
+        Initialize an InclinedTransfers object.
+
+        :param planets1: Planet objects for the departure planets
+        :param planets2: Planet objects for the arrival planets
+        """
+        if len(planets1) != len(planets2):
+            raise ValueError("Departure and arrival planet lists must have the same length.")
+        self.planets1 = list(planets1)
+        self.planets2 = list(planets2)
+
+        r1 = np.array([p.a for p in planets1], dtype=np.float64)
+        r2 = np.array([p.a for p in planets2], dtype=np.float64)
+        mu = G * np.array([p.M for p in planets1], dtype=np.float64)  # Assuming same central mass
+        a_transfer = (r1 + r2) / 2
+        semi_latus = 2 * r1 * r2 / (r1 + r2)
+
+        self.transfer_time = np.pi * np.sqrt(a_transfer ** 3 / mu)
+        self.departure_delta_v = np.abs(np.sqrt(mu * (2 / r1 - 1 / a_transfer)) - np.sqrt(mu / r1))
+        self.transfer_arrival_speed = np.sqrt(mu * (2 / r2 - 1 / a_transfer))
+        self.circular_arrival_speed = np.sqrt(mu / r2)
+        # Transverse speed at the midcourse point (r = semi-latus rectum); a plane change there leaves the radial part alone
+        self.midcourse_speed = np.sqrt(mu / semi_latus)
+
+        node1, in_plane1, self.normal1 = _orbit_axes(planets1)
+        node2, in_plane2, self.normal2 = _orbit_axes(planets2)
+        # Per-epoch geometry only needs dot products between the two orbits' axes
+        self._node_node = np.einsum("pk,pk->p", node1, node2)
+        self._node_in_plane = np.einsum("pk,pk->p", node1, in_plane2)
+        self._in_plane_node = np.einsum("pk,pk->p", in_plane1, node2)
+        self._in_plane_in_plane = np.einsum("pk,pk->p", in_plane1, in_plane2)
+        self._normal_node = np.einsum("pk,pk->p", self.normal1, node2)
+        self._normal_in_plane = np.einsum("pk,pk->p", self.normal1, in_plane2)
+        self._node_normal = np.einsum("pk,pk->p", node1, self.normal2)
+        self._in_plane_normal = np.einsum("pk,pk->p", in_plane1, self.normal2)
+        self.cos_mutual = np.clip(np.einsum("pk,pk->p", self.normal1, self.normal2), -1.0, 1.0)
+        self.mutual_inclination = np.arccos(self.cos_mutual)
+
+        # Combined arrival burn for a node-aligned arrival, through the full mutual inclination
+        self.arrival_delta_v = self._arrival_burn(np.arange(len(planets1)), self.cos_mutual)
+        self.coplanar_delta_v = self.departure_delta_v + np.abs(self.transfer_arrival_speed - self.circular_arrival_speed)
+
+        # Departure orbit phasing, used for the departure direction
+        self.raan1 = np.array([p.raan for p in planets1], dtype=np.float64)
+        self.theta1 = np.array([p.theta0 for p in planets1], dtype=np.float64)
+        self.n1 = np.array([2 * math.pi / p.orbital_period() for p in planets1], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.planets1)
+
+    def _arrival_burn(self, index: np.ndarray, cos_angle: np.ndarray) -> np.ndarray:
+        v_transfer, v_circular = self.transfer_arrival_speed[index], self.circular_arrival_speed[index]
+        return np.sqrt(v_transfer ** 2 + v_circular ** 2 - 2 * v_transfer * v_circular * cos_angle)
+
+    def _arrival_geometry(self, index: np.ndarray, departure_time: np.ndarray) -> tuple[np.ndarray, ...]:
+        """
+        Locate the departure point and the arrival point, where the transfer meets the target orbit.
+
+        With departure direction d = P1 cos u + Q1 sin u (P the node direction, Q 90 degrees along the
+        orbit), the midcourse direction is m = n1 x d = Q1 cos u - P1 sin u. The arrival point is the
+        point of the target orbit perpendicular to m, on the side opposite departure:
+        (Q2.m) P2 - (P2.m) Q2, normalized.
+
+        :return: Tuple of (cos u, sin u, sine and cosine of the arrival point's latitude above the departure plane)
+        """
+        u = self.theta1[index] + self.n1[index] * departure_time - self.raan1[index]
+        cos_u, sin_u = np.cos(u), np.sin(u)
+        # Arrival point (before normalizing) as a P2 + b Q2
+        a = self._in_plane_in_plane[index] * cos_u - self._node_in_plane[index] * sin_u
+        b = self._node_node[index] * sin_u - self._in_plane_node[index] * cos_u
+        length = np.hypot(a, b)
+
+        height = a * self._normal_node[index] + b * self._normal_in_plane[index]
+        toward_departure = (a * (cos_u * self._node_node[index] + sin_u * self._in_plane_node[index])
+                            + b * (cos_u * self._node_in_plane[index] + sin_u * self._in_plane_in_plane[index]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sin_latitude = np.where(toward_departure > 0, -height, height) / length
+            cos_latitude = np.abs(toward_departure) / length
+        # Zero length only when the target orbit is perpendicular to m; it then passes opposite departure
+        degenerate = length == 0
+        if np.any(degenerate):
+            sin_latitude, cos_latitude = np.where(degenerate, 0.0, sin_latitude), np.where(degenerate, 1.0, cos_latitude)
+        return cos_u, sin_u, sin_latitude, cos_latitude
+
+    def arrival_latitude(self, index: np.ndarray, departure_time: np.ndarray) -> np.ndarray:
+        """
+        Calculate the latitude of the arrival point above the departure orbit plane.
+
+        The arrival point is where the transfer meets the target orbit, opposite the departure
+        point; at a phase window the target is there on arrival.
+
+        :param index: Pair indices, broadcast against departure_time
+        :param departure_time: Departure times in seconds
+        :return: Latitudes in radians (0 when the arrival point is on the node line)
+        """
+        _, _, sin_latitude, cos_latitude = self._arrival_geometry(np.asarray(index), np.asarray(departure_time, dtype=np.float64))
+        return np.arctan2(sin_latitude, cos_latitude)
+
+    def delta_v_at(self, index: np.ndarray, departure_time: np.ndarray) -> np.ndarray:
+        """
+        Calculate the total transfer delta-v elementwise for (pair index, departure time).
+
+        The midcourse burn rotates the transfer plane about the midcourse position by the arrival
+        latitude; the arrival burn then covers the angle between that tilted plane and the target
+        orbit, so a node-aligned arrival pays the full mutual inclination at arrival only.
+
+        :param index: Pair indices, broadcast against departure_time
+        :param departure_time: Departure times in seconds
+        :return: Delta-v in m/s
+        """
+        index, departure_time = np.asarray(index), np.asarray(departure_time, dtype=np.float64)
+        cos_u, sin_u, sin_latitude, cos_latitude = self._arrival_geometry(index, departure_time)
+        # Rotating n1 about m by the latitude gives the tilted plane's normal n1 cos + d sin
+        departure_normal = cos_u * self._node_normal[index] + sin_u * self._in_plane_normal[index]
+        cos_arrival = np.clip(self.cos_mutual[index] * cos_latitude + departure_normal * sin_latitude, -1.0, 1.0)
+        # 2 v sin(latitude / 2) = v |sin| sqrt(2 / (1 + cos)), stable since cos_latitude >= 0
+        midcourse = self.midcourse_speed[index] * np.abs(sin_latitude) * np.sqrt(2 / (1 + cos_latitude))
+        return self.departure_delta_v[index] + midcourse + self._arrival_burn(index, cos_arrival)
+
+    def delta_v(self, departure_times) -> np.ndarray:
+        """
+        Calculate the total transfer delta-v of every pair at every departure time.
+
+        :param departure_times: Departure times in seconds, shape (K,) or (pairs, K)
+        :return: Array of shape (pairs, K) in m/s
+        """
+        departure_times = np.asarray(departure_times, dtype=np.float64)
+        index = np.arange(len(self))[:, None]
+        return self.delta_v_at(index, departure_times)
+
+    def windows(self, t_end: float, target_phase: float = 0,
+                t_start: float = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find every phase window in [t_start, t_end] together with its plane change cost.
+
+        Window times are the coplanar phase windows; no adjustment toward node crossings is made,
+        the cost only reflects where each window's arrival point lies relative to the node line.
+
+        :param t_end: End of the horizon in seconds
+        :param target_phase: Target phase angle in degrees
+        :param t_start: Start of the horizon in seconds
+        :return: Tuple of (pair index, window time, delta-v in m/s, arrival latitude in degrees) arrays
+        """
+        index, times, _ = batch_window_intervals(self.planets1, self.planets2, 0, t_end, target_phase, t_start)
+        latitude = self.arrival_latitude(index, times)
+        return index, times, self.delta_v_at(index, times), np.degrees(latitude)
+
+    def best_windows(self, t_end: float, target_phase: float = 0,
+                     t_start: float = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pick the cheapest phase window in [t_start, t_end] for each pair (window times are not adjusted).
+
+        :param t_end: End of the horizon in seconds
+        :param target_phase: Target phase angle in degrees
+        :param t_start: Start of the horizon in seconds
+        :return: Tuple of (pair index, window time, delta-v in m/s) arrays, one entry per pair with a window
+        """
+        index, times, cost, _ = self.windows(t_end, target_phase, t_start)
+        order = np.lexsort((cost, index))
+        index, times, cost = index[order], times[order], cost[order]
+        first = np.ones(index.size, dtype=bool)
+        first[1:] = index[1:] != index[:-1]
+        return index[first], times[first], cost[first]
@@ -1,7 +1,8 @@
 import math
 
 class Planet:
-    def __init__(self, name, semi_major_axis, mass, central_mass, initial_mean_anomaly=0.0):
+    def __init__(self, name, semi_major_axis, mass, central_mass, initial_mean_anomaly=0.0,
+                 inclination=0.0, longitude_of_ascending_node=0.0):
         """
         Initialize a Planet object.
 
@@ -10,12 +11,16 @@ class Planet:
         :param mass: Mass of the planet in kg (not used in calculations here)
         :param central_mass: Mass of the central body (e.g., star) in kg
         :param initial_mean_anomaly: Initial mean anomaly in degrees
+        :param inclination: Inclination of the orbit to the reference plane in degrees
+        :param longitude_of_ascending_node: Longitude of the ascending node in degrees
         """
         self.name = name
         self.a = semi_major_axis
         self.mass = mass
         self.M = central_mass
         self.theta0 = math.radians(initial_mean_anomaly)  # Convert to radians
+        self.i = math.radians(inclination)
+        self.raan = math.radians(longitude_of_ascending_node)
 
     def orbital_period(self):
         """
@@ -39,3 +44,30 @@ class Planet:
         """
         n = 2 * math.pi / self.orbital_period()  # Mean motion
         return self.theta0 + n * t
+
+    def orbit_normal(self):
+        """
+        Calculate the unit vector normal to the orbital plane.
+
+        :return: Tuple (x, y, z) along the orbital angular momentum
+        """
+        return (math.sin(self.i) * math.sin(self.raan),
+                -math.sin(self.i) * math.cos(self.raan),
+                math.cos(self.i))
+
+    def position_direction(self, t):
+        """
+        Calculate the unit vector from the central body to the planet at time t.
+
+        The mean longitude is measured from the reference direction to the ascending node
+        and then along the orbit, so coplanar orbits reduce to (cos, sin, 0) of it.
+
+        :param t: Time in seconds
+        :return: Tuple (x, y, z)
+        """
+        u = self.mean_longitude_at_time(t) - self.raan  # Argument of latitude
+        cos_u, sin_u = math.cos(u), math.sin(u)
+        cos_node, sin_node = math.cos(self.raan), math.sin(self.raan)
+        return (cos_node * cos_u - sin_node * sin_u * math.cos(self.i),
+                sin_node * cos_u + cos_node * sin_u * math.cos(self.i),
+                sin_u * math.sin(self.i))
@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from planet import Planet
+from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time, TransferPair
+from async_calculator import AsyncTransferCalculator
+
+class TestAsyncTransferCalculator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        self.calculator = AsyncTransferCalculator(chunk_size=7, max_pending=2)
+
+    async def test_phase_angles_match_sync(self):
+        queries = [(self.earth, self.mars, day * 86400.0) for day in range(50)]
+        results = await self.calculator.phase_angles(queries)
+        self.assertEqual(results, [phase_angle(p1, p2, t) for p1, p2, t in queries])
+
+    async def test_transfer_and_hohmann_batches(self):
+        pairs = [(self.mars, self.earth)] * 20
+        windows = await self.calculator.transfer_window_times([(p1, p2, 180) for p1, p2 in pairs])
+        hohmann = await self.calculator.hohmann_transfer_times(pairs)
+        self.assertEqual(windows, [transfer_window_time(self.mars, self.earth, 180)] * 20)
+        self.assertEqual(hohmann, [hohmann_transfer_time(self.mars, self.earth)] * 20)
+
+    async def test_custom_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calculator = AsyncTransferCalculator(executor=executor, chunk_size=3)
+            results = await calculator.phase_angles([(self.earth, self.mars, 0.0)] * 10)
+        self.assertEqual(len(results), 10)
+
+    async def test_iter_windows(self):
+        pair = TransferPair(self.earth, self.mars)
+        end = 100 * 365.25 * 86400
+        start = pair.window(2) + 1
+        windows = [t async for t in self.calculator.iter_windows(self.earth, self.mars, end, start=start)]
+        self.assertAlmostEqual(windows[0], pair.window(3))
+        self.assertTrue(all(start <= t <= end for t in windows))
+        self.assertEqual(len(windows), int((end - pair.window(3)) // pair.synodic_period) + 1)
+
+    async def test_iter_windows_empty_horizon(self):
+        windows = [t async for t in self.calculator.iter_windows(self.earth, self.mars, 1.0)]
+        self.assertEqual(windows, [])
+
+    async def test_errors_propagate(self):
+        twin = Planet("Twin", 149597870700, 6.39e23, 1.989e30, 0.0)
+        with self.assertRaises(ValueError):
+            await self.calculator.transfer_window_times([(self.earth, twin, 0)])
+
+    async def test_cancellation(self):
+        async def consume():
+            async for _ in self.calculator.iter_windows(self.earth, self.mars, 1e15):
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            AsyncTransferCalculator(chunk_size=0)
+        with self.assertRaises(ValueError):
+            AsyncTransferCalculator(max_pending=0)
+
+if __name__ == '__main__':
+    unittest.main()
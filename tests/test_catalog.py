@@ -0,0 +1,98 @@
+import math
+import os
+import tempfile
+import unittest
+import numpy as np
+from planet import Planet
+from transfer_calculator import TransferPair
+from catalog import BodyCatalog
+
+DAY = 86400
+
+class TestBodyCatalog(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.count = 20000
+        self.a = rng.uniform(0.3e11, 8e11, self.count)
+        self.theta0 = rng.uniform(0, 360, self.count)
+        self.catalog = BodyCatalog.from_arrays(self.a, 1.989e30, self.theta0)
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 25.0)
+
+    def test_layout(self):
+        self.assertEqual(len(self.catalog), self.count)
+        self.assertTrue(self.catalog.data.flags["C_CONTIGUOUS"])
+        self.assertTrue(self.catalog.n.flags["C_CONTIGUOUS"])
+        planet = self.catalog.planet(3)
+        self.assertAlmostEqual(self.catalog.n[3], 2 * math.pi / planet.orbital_period())
+
+    def test_from_planets(self):
+        mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        catalog = BodyCatalog.from_planets([mars])
+        self.assertAlmostEqual(catalog.theta0[0], mars.theta0)
+        self.assertAlmostEqual(catalog.a[0], mars.a)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            BodyCatalog.from_arrays([1e11, -1.0], 1.989e30, [0, 0])
+        with self.assertRaises(ValueError):
+            BodyCatalog.from_arrays([1e11], 0.0, [0])
+        with self.assertRaises(ValueError):
+            BodyCatalog(np.zeros((3, 5)))
+
+    def test_save_and_memory_map(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.npy")
+            self.catalog.save(path)
+            loaded = BodyCatalog.load(path)
+            self.assertIsInstance(loaded.data, np.memmap)
+            np.testing.assert_array_equal(loaded.data, self.catalog.data)
+            index, _ = loaded.build_index(self.earth).query(30 * DAY)
+            self.assertGreater(index.size, 0)
+            del loaded, index
+
+    def test_next_windows_match_transfer_pair(self):
+        windows = self.catalog.next_windows(self.earth, 44, t=100 * DAY)
+        for i in (0, 1, 2, 3):
+            pair = TransferPair(self.earth, self.catalog.planet(i), 44)
+            self.assertAlmostEqual(windows[i], pair.next_window(100 * DAY), delta=1e-3 * pair.synodic_period)
+
+    def test_query_matches_brute_force(self):
+        index = self.catalog.build_index(self.earth, rate_buckets=32)
+        for horizon, target, t in ((30 * DAY, 0, 0), (90 * DAY, 44, 500 * DAY), (5 * DAY, 180, 3000 * DAY)):
+            bodies, times = index.query(horizon, target, t)
+            windows = self.catalog.next_windows(self.earth, target, t)
+            expected = np.flatnonzero(windows <= t + horizon)
+            np.testing.assert_array_equal(np.sort(bodies), expected)
+            np.testing.assert_allclose(times, np.sort(windows[expected]))
+            self.assertTrue(np.all(np.diff(times) >= 0))
+
+    def test_candidates_prune_buckets(self):
+        index = self.catalog.build_index(self.earth)
+        candidates = index.candidates(10 * DAY, 0, 0)
+        self.assertLess(candidates.size, self.count // 5)
+
+    def test_query_far_from_key_epoch(self):
+        index = self.catalog.build_index(self.earth, rate_buckets=32, epoch=1e9)
+        for t in (0, 2e9):
+            bodies, _ = index.query(30 * DAY, 44, t)
+            windows = self.catalog.next_windows(self.earth, 44, t)
+            np.testing.assert_array_equal(np.sort(bodies), np.flatnonzero(windows <= t + 30 * DAY))
+
+    def test_rekey_restores_pruning(self):
+        index = self.catalog.build_index(self.earth)
+        near = index.candidates(30 * DAY, 0, 0).size
+        # Far from the key epoch the slices widen with the rate spread of each bucket
+        self.assertGreater(index.candidates(30 * DAY, 0, 1e9).size, 3 * near)
+        index.rekey(1e9)
+        self.assertLess(index.candidates(30 * DAY, 0, 1e9).size, self.count // 5)
+        bodies, _ = index.query(30 * DAY, 0, 1e9)
+        windows = self.catalog.next_windows(self.earth, 0, 1e9)
+        np.testing.assert_array_equal(np.sort(bodies), np.flatnonzero(windows <= 1e9 + 30 * DAY))
+
+    def test_co_orbital_bodies_never_match(self):
+        catalog = BodyCatalog.from_planets([self.earth])
+        bodies, _ = catalog.build_index(self.earth).query(1e12, 25.0)
+        self.assertEqual(bodies.size, 0)
+
+if __name__ == '__main__':
+    unittest.main()
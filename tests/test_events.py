@@ -0,0 +1,97 @@
+import math
+import unittest
+import numpy as np
+from planet import Planet
+from transfer_calculator import TransferPair
+from events import find_events, find_transfer_windows, phase_parameters
+
+class TestFindEvents(unittest.TestCase):
+    def test_sine_roots(self):
+        frequencies = np.array([1.0, 2.0, 3.0])
+
+        def func(index, t):
+            return np.sin(frequencies[index] * t)
+
+        index, times = find_events(func, 3, 0.5, 10.0, step=0.1, tolerance=1e-10)
+        for i, frequency in enumerate(frequencies):
+            expected = [k * math.pi / frequency for k in range(1, 100) if 0.5 <= k * math.pi / frequency <= 10.0]
+            np.testing.assert_allclose(times[index == i], expected, atol=1e-9)
+
+    def test_nonlinear_function(self):
+        # Roots of t^3 - 2 at cube root of 2, with a per-function step
+        def func(index, t):
+            return t ** 3 - 2.0 * (index + 1)
+
+        index, times = find_events(func, 2, 0.0, 3.0, step=np.array([0.25, 0.5]), tolerance=1e-12)
+        self.assertEqual(index.tolist(), [0, 1])
+        np.testing.assert_allclose(times, [2 ** (1 / 3), 4 ** (1 / 3)], atol=1e-10)
+
+    def test_exact_zero_on_grid(self):
+        index, times = find_events(lambda i, t: t - 1.0, 1, 0.0, 2.0, step=0.5)
+        self.assertEqual(times.tolist(), [1.0])
+        index, times = find_events(lambda i, t: t - 2.0, 1, 0.0, 2.0, step=0.5)
+        self.assertEqual(times.tolist(), [2.0])
+
+    def test_discontinuities_rejected(self):
+        # A sawtooth jumps from +1 to -1 without crossing zero continuously
+        def func(index, t):
+            return (t % 2.0) - 1.0
+
+        _, times = find_events(func, 1, 0.1, 5.9, step=0.1, max_jump=1.0, tolerance=1e-10)
+        np.testing.assert_allclose(times, [1.0, 3.0, 5.0], atol=1e-9)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            find_events(lambda i, t: t, 1, 1.0, 0.0, step=0.1)
+        with self.assertRaises(ValueError):
+            find_events(lambda i, t: t, 1, 0.0, 1.0, step=0.0)
+
+class TestFindTransferWindows(unittest.TestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        self.venus = Planet("Venus", 108208000000, 4.867e24, 1.989e30, 200.0)
+        self.jupiter = Planet("Jupiter", 778500000000, 1.898e27, 1.989e30, 75.0)
+
+    def test_phase_parameters(self):
+        phase0, rate = phase_parameters([self.earth], [self.mars])
+        pair = TransferPair(self.earth, self.mars)
+        self.assertAlmostEqual(phase0[0], pair.phase0)
+        self.assertAlmostEqual(rate[0], pair.phase_rate)
+        with self.assertRaises(ValueError):
+            phase_parameters([self.earth], [])
+
+    def test_matches_analytic_windows(self):
+        planets1 = [self.earth, self.mars, self.earth, self.venus]
+        planets2 = [self.mars, self.earth, self.jupiter, self.earth]
+        end = 50 * 365.25 * 86400
+        index, times = find_transfer_windows(planets1, planets2, end, target_phase=44)
+        for i, (p1, p2) in enumerate(zip(planets1, planets2)):
+            pair = TransferPair(p1, p2, 44)
+            expected = []
+            k = 0
+            while pair.window(k) <= end:
+                expected.append(pair.window(k))
+                k += 1
+            np.testing.assert_allclose(times[index == i], expected, atol=1e-2)
+
+    def test_identical_periods_error(self):
+        twin = Planet("Twin", 149597870700, 6.39e23, 1.989e30, 0.0)
+        with self.assertRaises(ValueError):
+            find_transfer_windows([self.earth], [twin], 1e9)
+
+    def test_too_few_samples_error(self):
+        for samples in (1, 2):
+            with self.assertRaises(ValueError):
+                find_transfer_windows([self.earth], [self.mars], 1e9, samples_per_period=samples)
+        index, _ = find_transfer_windows([self.earth], [self.mars], 50 * 365.25 * 86400, samples_per_period=3)
+        self.assertGreater(index.size, 0)
+
+    def test_no_pairs(self):
+        index, times = find_transfer_windows([], [], 1e9)
+        self.assertEqual(index.size, 0)
+        self.assertEqual(times.size, 0)
+        self.assertEqual(index.dtype, np.int64)
+
+if __name__ == '__main__':
+    unittest.main()
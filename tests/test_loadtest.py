@@ -0,0 +1,82 @@
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from workload import WorkloadRecorder, run_request
+from loadtest import synthetic_workload, recorded_workload, replay, command_driver, main, LoadTestReport
+
+EARTH_MARS = (149597870700, 5.972e24, 0.0, 227939366000, 6.39e23, 30.0, 1.989e30, 86400.0)
+
+class TestLoadTest(unittest.TestCase):
+    def test_synthetic_workload_is_reproducible(self):
+        self.assertEqual(synthetic_workload(5, seed=1), synthetic_workload(5, seed=1))
+        self.assertEqual(len(synthetic_workload(5, seed=1)[0]), 8)
+
+    def test_replay_core(self):
+        report = replay(synthetic_workload(200, seed=2), run_request)
+        self.assertEqual(report.requests, 200)
+        self.assertEqual(report.errors, 0)
+        self.assertGreater(report.throughput, 0)
+        self.assertLessEqual(report.percentile(50), report.percentile(99))
+        self.assertIn("Throughput", report.summary())
+
+    def test_replay_rate_limit(self):
+        report = replay([EARTH_MARS] * 5, lambda inputs: None, rate=100)
+        self.assertGreaterEqual(report.elapsed, 0.04)
+        self.assertIn("Target rate:  100.0 req/s", report.summary())
+
+    def test_replay_counts_queueing_behind_slow_requests(self):
+        # Requests take at least 20 ms but are due every 10 ms: each one waits longer than the last
+        report = replay([EARTH_MARS] * 5, lambda inputs: time.sleep(0.02), rate=100)
+        self.assertTrue(all(later > earlier for earlier, later in zip(report.latencies, report.latencies[1:])))
+        self.assertTrue(report.below_target)
+        self.assertIn("WARNING", report.summary())
+
+    def test_replay_workers_keep_schedule(self):
+        workload = [EARTH_MARS] * 10
+        serial = replay(workload, lambda inputs: time.sleep(0.02), rate=100)
+        pooled = replay(workload, lambda inputs: time.sleep(0.02), rate=100, workers=10)
+        self.assertEqual(pooled.requests, 10)
+        self.assertLess(max(pooled.latencies), max(serial.latencies))
+
+    def test_unthrottled_workers_time_from_send(self):
+        # Time waiting in the pool is not counted, so each worker's latencies fit within the run
+        report = replay([EARTH_MARS] * 8, lambda inputs: time.sleep(0.01), workers=2)
+        self.assertLessEqual(sum(report.latencies), 2 * report.elapsed)
+
+    def test_errors_counted(self):
+        def failing(inputs):
+            raise ValueError("boom")
+        report = replay([EARTH_MARS] * 3, failing)
+        self.assertEqual(report.errors, 3)
+
+    def test_percentile(self):
+        report = LoadTestReport([float(k) for k in range(1, 101)], 0, 1.0, None, None)
+        self.assertEqual(report.percentile(50), 51.0)
+        self.assertEqual(report.percentile(99), 99.0)
+        self.assertEqual(report.percentile(100), 100.0)
+
+    def test_command_driver(self):
+        driver = command_driver(f"{sys.executable} -c \"import sys; assert float(sys.argv[1]) > 0\" {{a1}}")
+        report = replay([EARTH_MARS], driver)
+        self.assertEqual(report.errors, 0)
+
+    def test_recorded_workload_and_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "workload.twl")
+            with WorkloadRecorder(path) as recorder:
+                recorder.record(EARTH_MARS, 0.001)
+                recorder.record(None, 0.001, ok=False)
+            self.assertEqual(recorded_workload(path), [EARTH_MARS])
+            self.assertEqual(recorded_workload(path, include_failed=True), [EARTH_MARS])
+            output = io.StringIO()
+            with redirect_stdout(output):
+                status = main(["--log", path, "--repeat", "3"])
+        self.assertEqual(status, 0)
+        self.assertIn("Requests:     3 (0 errors)", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -102,7 +102,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Semi-major axis for Planet 1 must be a valid positive number.")
+        mock_showerror.assert_called_with("Input Error", "Semi-major axis for Planet 1 must be positive.")
 
     @patch('main.messagebox.showerror')
     def test_calculate_zero_mass(self, mock_showerror):
@@ -119,7 +119,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Mass for Planet 1 must be a valid positive number.")
+        mock_showerror.assert_called_with("Input Error", "Mass for Planet 1 must be positive.")
 
     @patch('main.messagebox.showerror')
     def test_calculate_invalid_theta0(self, mock_showerror):
@@ -153,7 +153,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Initial Mean Anomaly for Planet 1 must be a valid number between 0 and 360.")
+        mock_showerror.assert_called_with("Input Error", "Initial Mean Anomaly for Planet 1 must be between 0 and 360 degrees.")
 
     @patch('main.messagebox.showerror')
     def test_calculate_theta0_over_360(self, mock_showerror):
@@ -170,7 +170,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Initial Mean Anomaly for Planet 1 must be a valid number between 0 and 360.")
+        mock_showerror.assert_called_with("Input Error", "Initial Mean Anomaly for Planet 1 must be between 0 and 360 degrees.")
 
     @patch('main.messagebox.showerror')
     def test_calculate_negative_time_days(self, mock_showerror):
@@ -187,7 +187,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Time (days) must be a valid non-negative number.")
+        mock_showerror.assert_called_with("Input Error", "Time (days) must be non-negative.")
 
     @patch('main.messagebox.showerror')
     def test_calculate_zero_central_mass(self, mock_showerror):
@@ -204,7 +204,7 @@ class TestTransferWindowCalculator(unittest.TestCase):
 
         self.app.calculate()
 
-        mock_showerror.assert_called_with("Input Error", "Central body mass must be a valid positive number.")
+        mock_showerror.assert_called_with("Input Error", "Central body mass must be positive.")
 
     @patch('main.messagebox.showerror')
     @patch('main.phase_angle')
@@ -323,5 +323,58 @@ class TestTransferWindowCalculator(unittest.TestCase):
         self.app.hohmann_time_label.config.assert_called()  # type: ignore
         mock_showerror.assert_not_called()
 
+    @patch('main.messagebox.showerror')
+    def test_calculate_records_workload(self, mock_showerror):
+        self.app.recorder = MagicMock()
+        self.app.planet1_name.get.return_value = "Earth"  # type: ignore
+        self.app.planet1_a.get.return_value = "149597870.7"  # type: ignore
+        self.app.planet1_mass.get.return_value = "5.972e24"  # type: ignore
+        self.app.planet1_theta0.get.return_value = "0"  # type: ignore
+        self.app.planet2_name.get.return_value = "Mars"  # type: ignore
+        self.app.planet2_a.get.return_value = "227939366.0"  # type: ignore
+        self.app.planet2_mass.get.return_value = "6.39e23"  # type: ignore
+        self.app.planet2_theta0.get.return_value = "0"  # type: ignore
+        self.app.central_mass.get.return_value = "1.989e30"  # type: ignore
+        self.app.time_days.get.return_value = "1"  # type: ignore
+
+        self.app.calculate()
+
+        self.app.recorder.record.assert_called_once()
+        inputs, latency, ok = self.app.recorder.record.call_args[0]
+        self.assertEqual(inputs, (149597870700.0, 5.972e24, 0.0, 227939366000.0, 6.39e23, 0.0, 1.989e30, 86400.0))
+        self.assertGreaterEqual(latency, 0)
+        self.assertTrue(ok)
+
+    @patch('main.messagebox.showerror')
+    def test_calculate_records_failed_workload(self, mock_showerror):
+        self.app.recorder = MagicMock()
+        self.app.planet1_a.get.return_value = "invalid"  # type: ignore
+
+        self.app.calculate()
+
+        inputs, _, ok = self.app.recorder.record.call_args[0]
+        self.assertIsNone(inputs)
+        self.assertFalse(ok)
+
+    @patch('main.messagebox.showerror')
+    def test_calculate_records_output_failure_once(self, mock_showerror):
+        self.app.recorder = MagicMock()
+        self.app.planet1_name.get.return_value = "Earth"  # type: ignore
+        self.app.planet1_a.get.return_value = "149597870.7"  # type: ignore
+        self.app.planet1_mass.get.return_value = "5.972e24"  # type: ignore
+        self.app.planet1_theta0.get.return_value = "0"  # type: ignore
+        self.app.planet2_name.get.return_value = "Mars"  # type: ignore
+        self.app.planet2_a.get.return_value = "227939366.0"  # type: ignore
+        self.app.planet2_mass.get.return_value = "6.39e23"  # type: ignore
+        self.app.planet2_theta0.get.return_value = "0"  # type: ignore
+        self.app.central_mass.get.return_value = "1.989e30"  # type: ignore
+        self.app.time_days.get.return_value = "1"  # type: ignore
+        self.app.phase_angle_label.configure.side_effect = RuntimeError("widget destroyed")  # type: ignore
+
+        self.app.calculate()
+
+        self.app.recorder.record.assert_called_once()
+        self.assertFalse(self.app.recorder.record.call_args[0][2])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from planet import Planet
+from transfer_calculator import TransferPair
+from nbody import NBodyPropagator
+
+class TestNBodyPropagator(unittest.TestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 40.0)
+
+    def test_initial_phase_matches_analytic(self):
+        propagator = NBodyPropagator([self.earth, self.mars])
+        self.assertAlmostEqual(propagator.phase_angle(0, 1), 40.0, places=6)
+
+    def test_test_particles_follow_analytic_windows(self):
+        # Negligible masses: the propagated phase should track the two-body prediction
+        earth = Planet("Earth", 149597870700, 1.0, 1.989e30, 0.0)
+        mars = Planet("Mars", 227939366000, 1.0, 1.989e30, 40.0)
+        pair = TransferPair(earth, mars)
+        windows = [pair.window(k) for k in range(5)]
+        propagator = NBodyPropagator([earth, mars])
+        discrepancies = propagator.window_discrepancies(0, 1, windows)
+        self.assertEqual(discrepancies.shape, (5,))
+        self.assertLess(np.max(np.abs(discrepancies)), 1e-3)
+
+    def test_inclined_test_particles_follow_analytic_windows(self):
+        earth = Planet("Earth", 149597870700, 1.0, 1.989e30, 0.0)
+        mars = Planet("Mars", 227939366000, 1.0, 1.989e30, 40.0, 10.0, 80.0)
+        pair = TransferPair(earth, mars)
+        windows = [pair.window(k) for k in range(5)]
+        discrepancies = NBodyPropagator([earth, mars]).window_discrepancies(0, 1, windows)
+        self.assertLess(np.max(np.abs(discrepancies)), 1e-3)
+
+    def test_perturbations_show_drift(self):
+        jupiter_like = Planet("Big", 227939366000, 1.9e27, 1.989e30, 40.0)
+        pair = TransferPair(self.earth, jupiter_like)
+        windows = [pair.window(k) for k in range(3)]
+        discrepancies = NBodyPropagator([self.earth, jupiter_like]).window_discrepancies(0, 1, windows)
+        self.assertGreater(np.max(np.abs(discrepancies)), 0.01)
+
+    def test_leapfrog_matches_yoshida(self):
+        end = 365.25 * 86400
+        yoshida = NBodyPropagator([self.earth, self.mars])
+        leapfrog = NBodyPropagator([self.earth, self.mars], method="leapfrog", steps_per_orbit=2000)
+        yoshida.propagate_to(end)
+        leapfrog.propagate_to(end)
+        self.assertAlmostEqual(yoshida.phase_angle(0, 1), leapfrog.phase_angle(0, 1), delta=0.01)
+
+    def test_checkpoint_restart(self):
+        year = 365.25 * 86400
+        continuous = NBodyPropagator([self.earth, self.mars])
+        continuous.propagate_to(2 * year)
+
+        first = NBodyPropagator([self.earth, self.mars])
+        first.propagate_to(year)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.npz")
+            first.save_checkpoint(path)
+            restored = NBodyPropagator.load_checkpoint(path)
+            # Paths without the .npz suffix are used as given
+            bare = os.path.join(tmp, "state")
+            first.save_checkpoint(bare)
+            self.assertEqual(NBodyPropagator.load_checkpoint(bare).t, year)
+        self.assertEqual(restored.t, year)
+        self.assertEqual([p.name for p in restored.planets], ["Earth", "Mars"])
+        restored.propagate_to(2 * year)
+        np.testing.assert_allclose(restored.positions, continuous.positions, rtol=1e-8, atol=1e3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            NBodyPropagator([])
+        with self.assertRaises(ValueError):
+            NBodyPropagator([self.earth], method="euler")
+        with self.assertRaises(ValueError):
+            NBodyPropagator([self.earth, Planet("X", 1e11, 1e20, 1e30)])
+        propagator = NBodyPropagator([self.earth, self.mars])
+        propagator.propagate_to(1e6)
+        with self.assertRaises(ValueError):
+            propagator.propagate_to(0)
+
+if __name__ == '__main__':
+    unittest.main()
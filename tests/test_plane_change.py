@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+from planet import Planet
+from transfer_calculator import TransferPair, hohmann_transfer_time
+from plane_change import InclinedTransfers
+
+DAY = 86400
+
+def rotated_velocity_delta_v(r1, r2, angle):
+    # Rotate the transfer velocity 90 degrees past periapsis about the position vector
+    mu = 6.67430e-11 * 1.989e30
+    e = abs(r2 - r1) / (r1 + r2)
+    p = 2 * r1 * r2 / (r1 + r2)
+    # Perifocal frame with the position along y: v = sqrt(mu / p) (-sin nu, e + cos nu)
+    velocity = np.sqrt(mu / p) * np.array([-1.0, e, 0.0])
+    c, s = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+    rotated = np.array([velocity[0] * c, velocity[1], velocity[0] * s])
+    return np.linalg.norm(rotated - velocity)
+
+class TestInclinedTransfers(unittest.TestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        self.inclined = Planet("Inclined", 227939366000, 1e20, 1.989e30, 30.0, 10.0, 80.0)
+
+    def test_coplanar_matches_hohmann(self):
+        transfers = InclinedTransfers([self.earth, self.mars], [self.mars, self.earth])
+        self.assertAlmostEqual(transfers.transfer_time[0], hohmann_transfer_time(self.earth, self.mars))
+        np.testing.assert_allclose(transfers.mutual_inclination, 0, atol=1e-12)
+        delta_v = transfers.delta_v(np.linspace(0, 1e8, 7))
+        self.assertEqual(delta_v.shape, (2, 7))
+        np.testing.assert_allclose(delta_v, np.broadcast_to(transfers.coplanar_delta_v[:, None], delta_v.shape), rtol=1e-12)
+        # Earth -> Mars Hohmann is about 5.6 km/s in total
+        self.assertAlmostEqual(transfers.coplanar_delta_v[0], 5.59e3, delta=50)
+
+    def test_mutual_inclination(self):
+        other = Planet("Other", 3e11, 1e20, 1.989e30, 0.0, 10.0, 260.0)
+        transfers = InclinedTransfers([self.earth, self.inclined], [self.inclined, other])
+        np.testing.assert_allclose(np.degrees(transfers.mutual_inclination), [10.0, 20.0], atol=1e-9)
+
+    def test_plane_change_cost(self):
+        transfers = InclinedTransfers([self.earth], [self.inclined])
+        delta_v = transfers.delta_v(np.linspace(0, 3e8, 500))[0]
+        # Never cheaper than coplanar, and node-aligned arrivals only pay the combined arrival burn
+        self.assertTrue(np.all(delta_v > transfers.coplanar_delta_v[0]))
+        node_cost = transfers.departure_delta_v[0] + transfers.arrival_delta_v[0]
+        self.assertAlmostEqual(delta_v.min(), node_cost, delta=0.01 * node_cost)
+        self.assertGreater(delta_v.max(), node_cost)
+
+    def test_midcourse_tilt_reduces_arrival_plane_change(self):
+        far = Planet("Far", 7.8e11, 1e20, 1.989e30, 30.0, 10.0, 80.0)
+        transfers = InclinedTransfers([self.earth, self.earth], [self.inclined, far])
+        # Departing at longitude 350 deg arrives at 170 deg, 90 deg past the targets' node at 80 deg
+        departure = np.radians(350) / transfers.n1[0]
+        for i, target in enumerate((self.inclined, far)):
+            self.assertAlmostEqual(np.degrees(transfers.arrival_latitude(i, departure)), 10.0, places=9)
+            # The midcourse burn already matches the target plane, so the arrival burn is coplanar
+            expected = (transfers.departure_delta_v[i] + rotated_velocity_delta_v(self.earth.a, target.a, 10.0)
+                        + abs(transfers.transfer_arrival_speed[i] - transfers.circular_arrival_speed[i]))
+            self.assertAlmostEqual(transfers.delta_v_at(i, departure), expected, delta=1e-6)
+
+    def test_arrival_latitude_bounded_by_inclination(self):
+        transfers = InclinedTransfers([self.earth], [self.inclined])
+        latitude = np.degrees(transfers.arrival_latitude(np.zeros(1000, dtype=int), np.linspace(0, 1e9, 1000)))
+        self.assertLessEqual(np.abs(latitude).max(), 10.0 + 1e-9)
+        self.assertGreater(np.abs(latitude).max(), 9.0)
+
+    def test_windows_and_best_windows(self):
+        transfers = InclinedTransfers([self.earth, self.earth], [self.inclined, self.mars])
+        end = 60 * 365.25 * DAY
+        index, times, cost, latitude = transfers.windows(end, target_phase=44)
+        pair = TransferPair(self.earth, self.inclined, 44)
+        np.testing.assert_allclose(times[index == 0][:3], [pair.window(k) for k in range(3)], atol=1e-3)
+
+        best_index, best_times, best_cost = transfers.best_windows(end, target_phase=44)
+        self.assertEqual(best_index.tolist(), [0, 1])
+        for i in (0, 1):
+            self.assertEqual(best_cost[i], cost[index == i].min())
+            self.assertIn(best_times[i], times[index == i])
+        # The cheapest inclined window arrives close to the node line
+        self.assertLess(abs(latitude[index == 0][np.argmin(cost[index == 0])]), np.abs(latitude[index == 0]).max())
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            InclinedTransfers([self.earth], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,13 @@ class TestPlanet(unittest.TestCase):
         self.assertEqual(self.earth.mass, 5.972e24)
         self.assertEqual(self.earth.M, 1.989e30)
         self.assertEqual(self.earth.theta0, 0.0)
+        self.assertEqual(self.earth.i, 0.0)
+        self.assertEqual(self.earth.raan, 0.0)
+
+    def test_init_inclined(self):
+        planet = Planet("Inclined", 1e11, 1e20, 1.989e30, 30.0, 10.0, 45.0)
+        self.assertAlmostEqual(planet.i, math.radians(10.0))
+        self.assertAlmostEqual(planet.raan, math.radians(45.0))
 
     def test_orbital_period(self):
         # Approximate orbital period for Earth in seconds
@@ -26,5 +33,24 @@ class TestPlanet(unittest.TestCase):
         actual_longitude = self.earth.mean_longitude_at_time(t)
         self.assertAlmostEqual(actual_longitude, expected_longitude, places=5)
 
+    def test_orbit_normal(self):
+        for x, expected in zip(self.earth.orbit_normal(), (0.0, 0.0, 1.0)):
+            self.assertAlmostEqual(x, expected)
+        polar = Planet("Polar", 1e11, 1e20, 1.989e30, 0.0, 90.0, 0.0)
+        for x, expected in zip(polar.orbit_normal(), (0.0, -1.0, 0.0)):
+            self.assertAlmostEqual(x, expected)
+
+    def test_position_direction(self):
+        # Coplanar orbits reduce to the mean longitude in the reference plane
+        mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        for x, expected in zip(mars.position_direction(0), (math.cos(math.radians(30)), math.sin(math.radians(30)), 0.0)):
+            self.assertAlmostEqual(x, expected)
+        # 90 degrees past the ascending node of an inclined orbit is its highest point
+        inclined = Planet("Inclined", 1e11, 1e20, 1.989e30, 120.0, 20.0, 30.0)
+        direction = inclined.position_direction(0)
+        self.assertAlmostEqual(direction[2], math.sin(math.radians(20.0)))
+        self.assertAlmostEqual(sum(x * x for x in direction), 1.0)
+        self.assertAlmostEqual(sum(d * n for d, n in zip(direction, inclined.orbit_normal())), 0.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import math
 from planet import Planet
-from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time
+from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time, TransferPair
 
 class TestTransferCalculator(unittest.TestCase):
     def setUp(self):
@@ -67,5 +67,49 @@ class TestTransferCalculator(unittest.TestCase):
         self.assertGreaterEqual(phi, 0)
         self.assertLess(phi, 360)
 
+class TestTransferPair(unittest.TestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 10.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 70.0)
+        self.pair = TransferPair(self.earth, self.mars, 44)
+
+    def test_matches_free_functions(self):
+        # Phase increases for an outer-to-inner pair, where the free function looks forward in time
+        reverse = TransferPair(self.mars, self.earth, 44)
+        self.assertAlmostEqual(reverse.window(0), transfer_window_time(self.mars, self.earth, 44), delta=1e-3)
+        self.assertAlmostEqual(self.pair.hohmann_time, hohmann_transfer_time(self.earth, self.mars))
+        for t in (0, 86400, 3.7e7, 1e9):
+            self.assertAlmostEqual(self.pair.phase_at(t), phase_angle(self.earth, self.mars, t), places=6)
+
+    def test_next_window(self):
+        synodic = self.pair.synodic_period
+        first = self.pair.window(0)
+        self.assertEqual(self.pair.next_window(0), first)
+        self.assertAlmostEqual(self.pair.next_window(first + 1), first + synodic)
+        self.assertAlmostEqual(self.pair.next_window(first + 2.5 * synodic), first + 3 * synodic)
+        self.assertAlmostEqual(self.pair.phase_at(self.pair.window(5)), 44, places=6)
+        # Before t = 0 the earlier windows are still found
+        early = self.pair.next_window(-1e9)
+        self.assertGreaterEqual(early, -1e9)
+        self.assertLess(early - synodic, -1e9)
+        self.assertAlmostEqual(self.pair.next_window(first - synodic), first - synodic)
+
+    def test_time_to_window(self):
+        t = 1e8
+        wait = self.pair.time_to_window(t)
+        self.assertGreaterEqual(wait, 0)
+        self.assertLess(wait, self.pair.synodic_period)
+
+    def test_decreasing_phase_is_forward_in_time(self):
+        # Earth -> Mars phase decreases; windows must still lie in the future
+        self.assertLess(self.pair.phase_rate, 0)
+        self.assertGreaterEqual(self.pair.window(0), 0)
+        self.assertAlmostEqual(self.pair.phase_at(self.pair.window(0)), 44, places=6)
+
+    def test_identical_periods_error(self):
+        planet2 = Planet("Planet2", 149597870700, 6.39e23, 1.989e30, 0.0)
+        with self.assertRaises(ValueError):
+            TransferPair(self.earth, planet2)
+
 if __name__ == '__main__':
     unittest.main()
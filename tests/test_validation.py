@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+from validation import (validate_value, validate_column, validate_columns, parse_column,
+                        POSITIVE, NON_NEGATIVE, ANGLE_DEGREES, VALID, INVALID_NUMBER, OUT_OF_RANGE)
+
+class TestValidateValue(unittest.TestCase):
+    def test_valid_values(self):
+        self.assertEqual(validate_value("1.5", POSITIVE, "Mass"), 1.5)
+        self.assertEqual(validate_value(" 0 ", NON_NEGATIVE, "Time"), 0.0)
+        self.assertEqual(validate_value("360", ANGLE_DEGREES, "Anomaly"), 360.0)
+
+    def test_invalid_number_message(self):
+        with self.assertRaisesRegex(ValueError, "^Mass must be a valid positive number.$"):
+            validate_value("abc", POSITIVE, "Mass")
+        with self.assertRaisesRegex(ValueError, "^Mass must be a valid positive number.$"):
+            validate_value("nan", POSITIVE, "Mass")
+
+    def test_out_of_range_message_keeps_reason(self):
+        with self.assertRaisesRegex(ValueError, "^Mass must be positive.$"):
+            validate_value("0", POSITIVE, "Mass")
+        with self.assertRaisesRegex(ValueError, "^Time must be non-negative.$"):
+            validate_value("-1", NON_NEGATIVE, "Time")
+        with self.assertRaisesRegex(ValueError, "^Anomaly must be between 0 and 360 degrees.$"):
+            validate_value("361", ANGLE_DEGREES, "Anomaly")
+
+class TestColumnValidation(unittest.TestCase):
+    def test_parse_column(self):
+        floats, invalid = parse_column(["1", "x", "inf", "2.5"])
+        self.assertEqual(floats[0], 1.0)
+        self.assertEqual(invalid.tolist(), [False, True, True, False])
+
+    def test_numeric_arrays_skip_parsing(self):
+        floats, codes = validate_column(np.array([1, 0, -2]), POSITIVE)
+        self.assertEqual(floats.dtype, np.float64)
+        self.assertEqual(codes.tolist(), [VALID, OUT_OF_RANGE, OUT_OF_RANGE])
+
+    def test_validate_column_codes(self):
+        _, codes = validate_column(["10", "-1", "bad", "400"], ANGLE_DEGREES)
+        self.assertEqual(codes.tolist(), [VALID, OUT_OF_RANGE, INVALID_NUMBER, OUT_OF_RANGE])
+
+    def test_validate_columns_collects_all_errors(self):
+        columns = {
+            "Semi-major axis": ["1e8", "0", "2e8", "x"],
+            "Initial Mean Anomaly": ["0", "90", "-5", "10"],
+        }
+        rules = {"Semi-major axis": POSITIVE, "Initial Mean Anomaly": ANGLE_DEGREES}
+        parsed, report = validate_columns(columns, rules)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.error_count, 3)
+        self.assertEqual(report.valid_mask().tolist(), [True, False, False, False])
+        self.assertEqual(report.summary(), {
+            "Semi-major axis": {"invalid": 1, "out_of_range": 1},
+            "Initial Mean Anomaly": {"invalid": 0, "out_of_range": 1},
+        })
+        self.assertEqual(report.messages(), [
+            "Row 2: Semi-major axis must be positive.",
+            "Row 3: Initial Mean Anomaly must be between 0 and 360 degrees.",
+            "Row 4: Semi-major axis must be a valid positive number.",
+        ])
+        self.assertEqual(report.messages(limit=1), ["Row 2: Semi-major axis must be positive."])
+        self.assertEqual(parsed["Semi-major axis"][2], 2e8)
+        with self.assertRaises(ValueError):
+            report.raise_if_errors()
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            validate_columns({"a": ["1"], "b": ["1", "2"]}, {"a": POSITIVE, "b": POSITIVE})
+
+if __name__ == '__main__':
+    unittest.main()
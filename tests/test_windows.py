@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+from planet import Planet
+from transfer_calculator import TransferPair
+from windows import IntervalSet, window_intervals, batch_window_intervals
+
+DAY = 86400
+
+class TestIntervalSet(unittest.TestCase):
+    def test_merges_overlapping_and_touching(self):
+        intervals = IntervalSet([5, 0, 2, 10], [6, 2, 3, 11])
+        self.assertEqual(list(intervals), [(0.0, 3.0), (5.0, 6.0), (10.0, 11.0)])
+        self.assertEqual(intervals.duration(), 5.0)
+
+    def test_invalid_intervals(self):
+        with self.assertRaises(ValueError):
+            IntervalSet([1], [0])
+        with self.assertRaises(ValueError):
+            IntervalSet([1, 2], [3])
+
+    def test_contains(self):
+        intervals = IntervalSet([0, 5], [2, 6])
+        self.assertEqual(intervals.contains([-1, 0, 1, 3, 5.5, 7]).tolist(), [False, True, True, False, True, False])
+        self.assertEqual(IntervalSet().contains([1.0]).tolist(), [False])
+
+    def test_set_operations(self):
+        a = IntervalSet([0, 10], [5, 20])
+        b = IntervalSet([3, 12, 18], [11, 15, 30])
+        self.assertEqual(list(a | b), [(0.0, 30.0)])
+        self.assertEqual(list(a & b), [(3.0, 5.0), (10.0, 11.0), (12.0, 15.0), (18.0, 20.0)])
+        self.assertEqual(list(a - b), [(0.0, 3.0), (11.0, 12.0), (15.0, 18.0)])
+        self.assertEqual(list(a & IntervalSet()), [])
+        self.assertEqual(a - IntervalSet(), a)
+
+    def test_touching_intersection_is_empty(self):
+        self.assertEqual(len(IntervalSet([0], [1]) & IntervalSet([1], [2])), 0)
+
+class TestWindowIntervals(unittest.TestCase):
+    def setUp(self):
+        self.earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        self.mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        self.jupiter = Planet("Jupiter", 778500000000, 1.898e27, 1.989e30, 75.0)
+
+    def test_intervals_bracket_windows(self):
+        pair = TransferPair(self.earth, self.mars, 44)
+        end = 20 * 365.25 * DAY
+        intervals = window_intervals(self.earth, self.mars, 5, end, target_phase=44)
+        half_width = 5 / abs(pair.phase_rate)
+        for k, (start, stop) in enumerate(intervals):
+            self.assertAlmostEqual(start, pair.window(k) - half_width, delta=1e-3)
+            self.assertAlmostEqual(stop, pair.window(k) + half_width, delta=1e-3)
+            offset = (pair.phase_at(np.array([start, stop])) - 44 + 180) % 360 - 180
+            np.testing.assert_allclose(np.abs(offset), 5, atol=1e-6)
+
+    def test_horizon_clipping(self):
+        pair = TransferPair(self.earth, self.mars)
+        window = pair.window(1)
+        intervals = window_intervals(self.earth, self.mars, 10, window + DAY, t_start=window - DAY)
+        self.assertEqual(list(intervals), [(window - DAY, window + DAY)])
+
+    def test_full_tolerance_covers_horizon(self):
+        intervals = window_intervals(self.earth, self.mars, 180, 100.0, t_start=10.0)
+        self.assertEqual(list(intervals), [(10.0, 100.0)])
+
+    def test_batch_matches_single(self):
+        planets1 = [self.earth, self.mars, self.earth]
+        planets2 = [self.mars, self.earth, self.jupiter]
+        end = 30 * 365.25 * DAY
+        index, starts, ends = batch_window_intervals(planets1, planets2, 3, end, target_phase=180, t_start=DAY)
+        for i, (p1, p2) in enumerate(zip(planets1, planets2)):
+            single = window_intervals(p1, p2, 3, end, target_phase=180, t_start=DAY)
+            np.testing.assert_allclose(starts[index == i], single.starts)
+            np.testing.assert_allclose(ends[index == i], single.ends)
+
+    def test_scheduling_constraint(self):
+        end = 10 * 365.25 * DAY
+        mars = window_intervals(self.earth, self.mars, 10, end)
+        jupiter = window_intervals(self.earth, self.jupiter, 10, end)
+        both = mars & jupiter
+        self.assertLessEqual(both.duration(), min(mars.duration(), jupiter.duration()))
+        self.assertTrue(np.all(mars.contains(both.starts) & jupiter.contains(both.starts)))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            window_intervals(self.earth, self.mars, -1, 1e9)
+        with self.assertRaises(ValueError):
+            window_intervals(self.earth, self.mars, 1, 0, t_start=10)
+
+if __name__ == '__main__':
+    unittest.main()
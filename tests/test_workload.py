@@ -0,0 +1,62 @@
+import math
+import os
+import tempfile
+import unittest
+from planet import Planet
+from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time
+from workload import WorkloadRecorder, read_workload, run_request, INPUT_FIELDS, MAGIC, RECORD
+
+EARTH_MARS = (149597870700, 5.972e24, 0.0, 227939366000, 6.39e23, 30.0, 1.989e30, 86400.0)
+
+class TestWorkload(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "workload.twl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_and_read(self):
+        with WorkloadRecorder(self.path) as recorder:
+            recorder.record(EARTH_MARS, 0.001, timestamp=100.0)
+            recorder.record(None, 0.002, ok=False, timestamp=101.0)
+        records = list(read_workload(self.path))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0].inputs, EARTH_MARS)
+        self.assertEqual((records[0].timestamp, records[0].latency, records[0].ok), (100.0, 0.001, True))
+        self.assertFalse(records[1].ok)
+        self.assertTrue(all(math.isnan(value) for value in records[1].inputs))
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 2 * RECORD.size)
+
+    def test_append_only(self):
+        for _ in range(2):
+            with WorkloadRecorder(self.path) as recorder:
+                recorder.record(EARTH_MARS, 0.001)
+        self.assertEqual(len(list(read_workload(self.path))), 2)
+
+    def test_partial_record_ignored(self):
+        with WorkloadRecorder(self.path) as recorder:
+            recorder.record(EARTH_MARS, 0.001)
+        with open(self.path, "ab") as f:
+            f.write(b"\x00" * 5)
+        self.assertEqual(len(list(read_workload(self.path))), 1)
+
+    def test_invalid_inputs(self):
+        with WorkloadRecorder(self.path) as recorder:
+            with self.assertRaises(ValueError):
+                recorder.record((1.0, 2.0), 0.001)
+        with open(self.path, "wb") as f:
+            f.write(b"not a log")
+        with self.assertRaises(ValueError):
+            list(read_workload(self.path))
+
+    def test_run_request_matches_core(self):
+        self.assertEqual(len(EARTH_MARS), len(INPUT_FIELDS))
+        earth = Planet("Earth", 149597870700, 5.972e24, 1.989e30, 0.0)
+        mars = Planet("Mars", 227939366000, 6.39e23, 1.989e30, 30.0)
+        self.assertEqual(run_request(EARTH_MARS), (phase_angle(earth, mars, 86400.0),
+                                                   transfer_window_time(earth, mars),
+                                                   hohmann_transfer_time(earth, mars)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,3 +53,77 @@ def hohmann_transfer_time(planet1, planet2):
     G = 6.67430e-11
     M = planet1.M  # Assuming same central mass
     return math.pi * math.sqrt(a_transfer**3 / (G * M))
+
+
+class TransferPair:
+    """
+    Precomputed transfer geometry for a fixed pair of planets.
+
+    All pair-level invariants (relative mean motion, synodic period, initial
+    phase offset and Hohmann transfer time) are derived once on construction,
+    so repeated queries reduce to a few float operations each.
+    """
+    def __init__(self, planet1, planet2, target_phase=0):
+        """
+        Initialize a TransferPair object.
+
+        :param planet1: Planet object for the departure planet
+        :param planet2: Planet object for the arrival planet
+        :param target_phase: Target phase angle in degrees (0 for inner to outer, 180 for outer to inner)
+        """
+        n1 = 2 * math.pi / planet1.orbital_period()
+        n2 = 2 * math.pi / planet2.orbital_period()
+        delta_n = n2 - n1
+
+        if abs(delta_n) < 1e-10:
+            raise ValueError("Planets have nearly identical orbital periods; transfer window calculation not applicable.")
+
+        self.planet1 = planet1
+        self.planet2 = planet2
+        self.target_phase = target_phase
+        self.phase_rate = math.degrees(delta_n)  # Degrees per second
+        self.synodic_period = 360 / abs(self.phase_rate)
+        self.phase0 = phase_angle(planet1, planet2, 0)
+        self.hohmann_time = hohmann_transfer_time(planet1, planet2)
+
+        # Time of the first window at or after t = 0, in whichever direction the phase moves
+        if self.phase_rate > 0:
+            self.first_window = ((target_phase - self.phase0) % 360) / self.phase_rate
+        else:
+            self.first_window = ((self.phase0 - target_phase) % 360) / -self.phase_rate
+
+    def phase_at(self, t):
+        """
+        Calculate the phase angle between the two planets at time t.
+
+        :param t: Time in seconds
+        :return: Phase angle in degrees
+        """
+        return (self.phase0 + self.phase_rate * t) % 360
+
+    def window(self, k):
+        """
+        Calculate the time of the k-th transfer window (k = 0 is the first at or after t = 0).
+
+        :param k: Window index
+        :return: Time in seconds of the window
+        """
+        return self.first_window + k * self.synodic_period
+
+    def next_window(self, t=0):
+        """
+        Calculate the time of the next transfer window at or after time t.
+
+        :param t: Time in seconds
+        :return: Time in seconds of the next window
+        """
+        return self.window(math.ceil((t - self.first_window) / self.synodic_period))
+
+    def time_to_window(self, t=0):
+        """
+        Calculate the time remaining from t until the next transfer window.
+
+        :param t: Time in seconds
+        :return: Time in seconds until the next window
+        """
+        return self.next_window(t) - t
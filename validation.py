@@ -0,0 +1,212 @@
+"""
+Input Validation
+
+Validation rules for transfer calculator inputs, shared between the GUI (one value at a time)
+and bulk imports (whole columns of values at once).
+"""
+import math
+from typing import Callable, Iterable, Mapping, Optional
+
+import numpy as np
+
+PHASE_ANGLE_MAX = 360
+
+# Error codes used in column validation
+VALID = 0
+INVALID_NUMBER = 1
+OUT_OF_RANGE = 2
+
+
+class Rule:
+    """
+    A validation rule for a numeric input.
+
+    The check is written with NumPy comparisons so the same callable works on a single
+    float and on a whole column.
+    """
+    def __init__(self, name: str, check: Callable, invalid_message: str, range_message: str) -> None:
+        """
+        Initialize a Rule object.
+
+        :param name: Short name of the rule
+        :param check: Callable returning True (or a boolean mask) where values satisfy the rule
+        :param invalid_message: Message suffix for values that are not valid numbers
+        :param range_message: Message suffix for numbers that fail the check
+        """
+        self.name = name
+        self.check = check
+        self.invalid_message = invalid_message
+        self.range_message = range_message
+
+
+POSITIVE = Rule("positive", lambda v: v > 0,
+                "must be a valid positive number.", "must be positive.")
+NON_NEGATIVE = Rule("non_negative", lambda v: v >= 0,
+                    "must be a valid non-negative number.", "must be non-negative.")
+ANGLE_DEGREES = Rule("angle_degrees", lambda v: (v >= 0) & (v <= PHASE_ANGLE_MAX),
+                     f"must be a valid number between 0 and {PHASE_ANGLE_MAX}.",
+                     f"must be between 0 and {PHASE_ANGLE_MAX} degrees.")
+
+
+def validate_value(text, rule: Rule, field_name: str) -> float:
+    """
+    Parse and validate a single value.
+
+    :param text: The raw value (usually a string from an entry widget)
+    :param rule: The rule to apply
+    :param field_name: Name of the field for error messages
+    :return: The validated float value
+    """
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field_name} {rule.invalid_message}")
+    if not math.isfinite(value):
+        raise ValueError(f"{field_name} {rule.invalid_message}")
+    if not rule.check(value):
+        raise ValueError(f"{field_name} {rule.range_message}")
+    return value
+
+
+def _parse_or_nan(text) -> float:
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def parse_column(values: Iterable) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a column of values into floats.
+
+    :param values: Sequence or array of strings or numbers
+    :return: Tuple of (float64 array, boolean mask of values that are not finite numbers)
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fiub":
+        floats = values.astype(np.float64, copy=False)
+    else:
+        values = list(values)
+        try:
+            floats = np.fromiter(map(float, values), np.float64, len(values))
+        except (TypeError, ValueError):
+            # Slow path only when the column contains unparseable entries
+            floats = np.fromiter(map(_parse_or_nan, values), np.float64, len(values))
+    return floats, ~np.isfinite(floats)
+
+
+def validate_column(values: Iterable, rule: Rule) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse and validate a column of values.
+
+    :param values: Sequence or array of strings or numbers
+    :param rule: The rule to apply
+    :return: Tuple of (float64 array, uint8 array of error codes per row)
+    """
+    floats, invalid = parse_column(values)
+    codes = np.zeros(floats.shape, dtype=np.uint8)
+    with np.errstate(invalid="ignore"):
+        codes[~invalid & ~rule.check(floats)] = OUT_OF_RANGE
+    codes[invalid] = INVALID_NUMBER
+    return floats, codes
+
+
+class ValidationReport:
+    """
+    Row-level errors collected from validating several columns.
+
+    Only failing rows are stored, as (row index, error code) arrays per field.
+    """
+    def __init__(self, row_count: int) -> None:
+        self.row_count = row_count
+        self.errors: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self.rules: dict[str, Rule] = {}
+
+    def add(self, field_name: str, rule: Rule, codes: np.ndarray) -> None:
+        """
+        Record the failing rows of a validated column.
+
+        :param field_name: Name of the field
+        :param rule: The rule the column was validated against
+        :param codes: Error codes per row, as returned by validate_column
+        """
+        rows = np.flatnonzero(codes)
+        if rows.size:
+            self.errors[field_name] = (rows, codes[rows])
+            self.rules[field_name] = rule
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def error_count(self) -> int:
+        return sum(rows.size for rows, _ in self.errors.values())
+
+    def valid_mask(self) -> np.ndarray:
+        """
+        :return: Boolean array, True for rows without any errors
+        """
+        mask = np.ones(self.row_count, dtype=bool)
+        for rows, _ in self.errors.values():
+            mask[rows] = False
+        return mask
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """
+        :return: Error counts per field, split into invalid numbers and out-of-range values
+        """
+        return {
+            field_name: {
+                "invalid": int(np.count_nonzero(codes == INVALID_NUMBER)),
+                "out_of_range": int(np.count_nonzero(codes == OUT_OF_RANGE)),
+            }
+            for field_name, (rows, codes) in self.errors.items()
+        }
+
+    def messages(self, limit: Optional[int] = None) -> list[str]:
+        """
+        Format errors as human-readable messages, ordered by row.
+
+        Row numbers in messages are 1-based (the first data row is "Row 1"); the row
+        indices stored in ``errors`` and returned by ``valid_mask`` stay 0-based.
+
+        :param limit: Maximum number of messages to return (all when None)
+        :return: List of messages such as "Row 3: Mass must be positive."
+        """
+        entries = []
+        for field_name, (rows, codes) in self.errors.items():
+            rule = self.rules[field_name]
+            count = rows.size if limit is None else min(rows.size, limit)
+            for row, code in zip(rows[:count].tolist(), codes[:count].tolist()):
+                reason = rule.invalid_message if code == INVALID_NUMBER else rule.range_message
+                entries.append((row, f"Row {row + 1}: {field_name} {reason}"))
+        entries.sort(key=lambda entry: entry[0])
+        return [message for _, message in entries[:limit]]
+
+    def raise_if_errors(self) -> None:
+        """
+        Raise a ValueError describing the first error, if there are any.
+        """
+        if not self.ok:
+            raise ValueError(f"{self.error_count} validation error(s); first: {self.messages(1)[0]}")
+
+
+def validate_columns(columns: Mapping[str, Iterable], rules: Mapping[str, Rule]) -> tuple[dict[str, np.ndarray], ValidationReport]:
+    """
+    Parse and validate several equally long columns, collecting every row-level error.
+
+    :param columns: Mapping of field name to column values
+    :param rules: Mapping of field name to the rule for that column
+    :return: Tuple of (mapping of field name to float64 array, ValidationReport)
+    """
+    parsed = {}
+    report = None
+    for field_name, values in columns.items():
+        floats, codes = validate_column(values, rules[field_name])
+        if report is None:
+            report = ValidationReport(floats.size)
+        elif floats.size != report.row_count:
+            raise ValueError(f"Column {field_name} has {floats.size} rows, expected {report.row_count}.")
+        report.add(field_name, rules[field_name], codes)
+        parsed[field_name] = floats
+    return parsed, report if report is not None else ValidationReport(0)
@@ -0,0 +1,180 @@
+"""
+Window Intervals
+
+Transfer windows as time intervals rather than instants: the spans during which the phase angle is
+within a tolerance of the target. Intervals are computed analytically for circular orbits, in
+batches over many pairs, and can be combined with IntervalSet to apply scheduling constraints.
+"""
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from events import phase_parameters
+
+
+class IntervalSet:
+    """
+    A set of disjoint, sorted time intervals stored as start and end arrays.
+
+    Overlapping or touching intervals are merged on construction.
+    """
+    def __init__(self, starts=(), ends=()) -> None:
+        """
+        Initialize an IntervalSet object.
+
+        :param starts: Interval start times in seconds
+        :param ends: Interval end times in seconds
+        """
+        starts = np.asarray(starts, dtype=np.float64).ravel()
+        ends = np.asarray(ends, dtype=np.float64).ravel()
+        if starts.shape != ends.shape:
+            raise ValueError("Interval starts and ends must have the same length.")
+        if np.any(ends < starts):
+            raise ValueError("Interval end must not be before its start.")
+        self.starts, self.ends = _merge(starts, ends)
+
+    def __len__(self) -> int:
+        return self.starts.size
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(self.starts.tolist(), self.ends.tolist())
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends)
+
+    def duration(self) -> float:
+        """
+        :return: Total length of all intervals in seconds
+        """
+        return float(np.sum(self.ends - self.starts))
+
+    def contains(self, t) -> np.ndarray:
+        """
+        Check which times fall inside the set.
+
+        :param t: Time or array of times in seconds
+        :return: Boolean array, True where t lies in an interval
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if self.starts.size == 0:
+            return np.zeros(t.shape, dtype=bool)
+        position = np.searchsorted(self.starts, t, side="right") - 1
+        return (position >= 0) & (t <= self.ends[np.maximum(position, 0)])
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        :return: IntervalSet covering times in either set
+        """
+        return IntervalSet(np.concatenate((self.starts, other.starts)), np.concatenate((self.ends, other.ends)))
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        :return: IntervalSet covering times in both sets
+        """
+        return _combine(self, other, lambda in_self, in_other: in_self & in_other)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        :return: IntervalSet covering times in this set but not in other
+        """
+        return _combine(self, other, lambda in_self, in_other: in_self & ~in_other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def _merge(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    if starts.size == 0:
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], np.maximum.accumulate(ends[order])
+    first = np.empty(starts.size, dtype=bool)
+    first[0] = True
+    first[1:] = starts[1:] > ends[:-1]
+    last = np.append(np.flatnonzero(first)[1:] - 1, starts.size - 1)
+    return starts[first], ends[last]
+
+
+def _combine(a: IntervalSet, b: IntervalSet, keep) -> IntervalSet:
+    """
+    Sweep the endpoints of both sets and keep the elementary segments selected by keep(in_a, in_b).
+    """
+    times = np.concatenate((a.starts, a.ends, b.starts, b.ends))
+    if times.size == 0:
+        return IntervalSet()
+    count_a, count_b = a.starts.size, b.starts.size
+    step_a = np.concatenate((np.ones(count_a), -np.ones(count_a), np.zeros(2 * count_b)))
+    step_b = np.concatenate((np.zeros(2 * count_a), np.ones(count_b), -np.ones(count_b)))
+
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    depth_a, depth_b = np.cumsum(step_a[order]), np.cumsum(step_b[order])
+    # State after all events at the same time
+    group_end = np.append(times[1:] != times[:-1], True)
+    times, depth_a, depth_b = times[group_end], depth_a[group_end], depth_b[group_end]
+
+    selected = keep(depth_a[:-1] > 0, depth_b[:-1] > 0)
+    return IntervalSet(times[:-1][selected], times[1:][selected])
+
+
+def batch_window_intervals(planets1: Sequence, planets2: Sequence, tolerance: float, t_end: float,
+                           target_phase: float = 0, t_start: float = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find every interval in [t_start, t_end] during which the phase is within tolerance of the target, for many pairs.
+
+    :param planets1: Planet objects for the departure planets
+    :param planets2: Planet objects for the arrival planets
+    :param tolerance: Allowed phase deviation from the target in degrees
+    :param t_end: End of the horizon in seconds
+    :param target_phase: Target phase angle in degrees
+    :param t_start: Start of the horizon in seconds
+    :return: Tuple of (pair index, interval start, interval end) arrays, sorted by pair then time
+    """
+    if tolerance < 0:
+        raise ValueError("Tolerance must be non-negative.")
+    if t_end < t_start:
+        raise ValueError("End of the horizon must not be before its start.")
+    phase0, rate = phase_parameters(planets1, planets2)
+    if np.any(np.abs(rate) < np.degrees(1e-10)):
+        raise ValueError("Planets have nearly identical orbital periods; transfer window calculation not applicable.")
+
+    if tolerance >= 180:
+        index = np.arange(phase0.size)
+        return index, np.full(index.size, float(t_start)), np.full(index.size, float(t_end))
+
+    synodic = 360 / np.abs(rate)
+    half_width = tolerance / np.abs(rate)
+    first = np.where(rate > 0, (target_phase - phase0) % 360, (phase0 - target_phase) % 360) / np.abs(rate)
+    k_min = np.ceil((t_start - half_width - first) / synodic)
+    k_max = np.floor((t_end + half_width - first) / synodic)
+    counts = np.maximum(k_max - k_min + 1, 0).astype(np.int64)
+
+    index = np.repeat(np.arange(phase0.size), counts)
+    k = k_min[index] + np.arange(index.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    centers = first[index] + k * synodic[index]
+    starts = np.maximum(centers - half_width[index], t_start)
+    ends = np.minimum(centers + half_width[index], t_end)
+    return index, starts, ends
+
+
+def window_intervals(planet1, planet2, tolerance: float, t_end: float, target_phase: float = 0,
+                     t_start: float = 0) -> IntervalSet:
+    """
+    Find the intervals in [t_start, t_end] during which the phase is within tolerance of the target.
+
+    :param planet1: Planet object for the departure planet
+    :param planet2: Planet object for the arrival planet
+    :param tolerance: Allowed phase deviation from the target in degrees
+    :param t_end: End of the horizon in seconds
+    :param target_phase: Target phase angle in degrees
+    :param t_start: Start of the horizon in seconds
+    :return: IntervalSet of window intervals
+    """
+    _, starts, ends = batch_window_intervals([planet1], [planet2], tolerance, t_end, target_phase, t_start)
+    return IntervalSet(starts, ends)
@@ -0,0 +1,116 @@
+"""
+Workload Recording
+
+Append-only binary log of calculation requests (normalized inputs, timestamp, latency), so that
+production workloads can be replayed against the core library with loadtest.py.
+"""
+import math
+import os
+import struct
+import threading
+import time
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Sequence
+
+from planet import Planet
+from transfer_calculator import phase_angle, transfer_window_time, hohmann_transfer_time
+
+MAGIC = b"TWCWL1\n"
+# Normalized inputs in SI units (angles in degrees), in record order
+INPUT_FIELDS = ("a1", "mass1", "theta1", "a2", "mass2", "theta2", "central_mass", "time")
+# Timestamp (s since epoch), latency (s), inputs, success flag
+RECORD = struct.Struct("<dd" + "d" * len(INPUT_FIELDS) + "?")
+MISSING_INPUTS = (math.nan,) * len(INPUT_FIELDS)
+
+
+class WorkloadRecord(NamedTuple):
+    timestamp: float
+    latency: float
+    inputs: tuple
+    ok: bool
+
+
+class WorkloadRecorder:
+    """
+    Append calculation requests to a workload log as fixed-size binary records.
+
+    Safe to share between threads; each record is written with a single call.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Initialize a WorkloadRecorder object.
+
+        :param path: Log file path, created with a header if it does not exist
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: BinaryIO = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def record(self, inputs: Optional[Sequence[float]], latency: float, ok: bool = True,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Append one calculation request.
+
+        :param inputs: Normalized inputs in INPUT_FIELDS order, or None if they could not be parsed
+        :param latency: Time taken by the calculation in seconds
+        :param ok: Whether the calculation succeeded
+        :param timestamp: Request time in seconds since the epoch (defaults to now)
+        """
+        inputs = MISSING_INPUTS if inputs is None else tuple(inputs)
+        if len(inputs) != len(INPUT_FIELDS):
+            raise ValueError(f"Workload inputs must have {len(INPUT_FIELDS)} values.")
+        data = RECORD.pack(time.time() if timestamp is None else timestamp, latency, *inputs, ok)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "WorkloadRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_workload(path: str) -> Iterator[WorkloadRecord]:
+    """
+    Read the records of a workload log.
+
+    :param path: Log file path
+    :return: Iterator of WorkloadRecord, in the order they were written
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a workload log.")
+        while True:
+            data = f.read(RECORD.size)
+            if len(data) < RECORD.size:
+                # Ignore a partial record left by an interrupted write
+                return
+            timestamp, latency, *inputs, ok = RECORD.unpack(data)
+            yield WorkloadRecord(timestamp, latency, tuple(inputs), ok)
+
+
+def run_request(inputs: Sequence[float]) -> tuple[float, float, float]:
+    """
+    Run the calculations of one request against the core library, as the GUI does.
+
+    :param inputs: Normalized inputs in INPUT_FIELDS order
+    :return: Tuple of (phase angle in degrees, transfer window time in s, Hohmann transfer time in s)
+    """
+    a1, mass1, theta1, a2, mass2, theta2, central_mass, t = inputs
+    planet1 = Planet("Planet 1", a1, mass1, central_mass, theta1)
+    planet2 = Planet("Planet 2", a2, mass2, central_mass, theta2)
+    return phase_angle(planet1, planet2, t), transfer_window_time(planet1, planet2), hohmann_transfer_time(planet1, planet2)
+
+
+def default_log_path() -> Optional[str]:
+    """
+    :return: Workload log path from the TWC_WORKLOAD_LOG environment variable, if set
+    """
+    return os.environ.get("TWC_WORKLOAD_LOG") or None